@@ -11,6 +11,9 @@ Validates that an algorithm implementation meets all 5 completeness criteria:
 Usage:
     python scripts/check_algorithm_completeness.py 1.4
     python scripts/check_algorithm_completeness.py 2.2
+    python scripts/check_algorithm_completeness.py 1.1 1.2 2.2   # or 1.1,1.2,2.2
+    python scripts/check_algorithm_completeness.py --all
+    python scripts/check_algorithm_completeness.py 2.2 --no-cache
 
 Exit codes:
     0: All checks passed
@@ -20,14 +23,160 @@ Exit codes:
 from __future__ import annotations
 
 import argparse
+import ast
+import compileall
+import contextlib
+import functools
+import hashlib
+import importlib.metadata
+import io
+import json
+import os
+import re
 import subprocess
 import sys
+from collections.abc import Callable
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Final
+from typing import Any, Final
 
 # Project root is parent of scripts/ directory
 PROJECT_ROOT: Final[Path] = Path(__file__).parent.parent
 
+# Interpreter for tool subprocesses: the project virtualenv when present.
+_VENV_PYTHON: Final[Path] = PROJECT_ROOT / ".venv" / "bin" / "python3"
+PYTHON_CMD: Final[str] = str(_VENV_PYTHON) if _VENV_PYTHON.exists() else sys.executable
+
+ALGO_DIR: Final[Path] = PROJECT_ROOT / "src" / "algorithms"
+TESTS_DIR: Final[Path] = PROJECT_ROOT / "tests"
+
+# Environment for tool subprocesses: skip writing .pyc files for one-off tool
+# imports and keep child output unbuffered.  Children of the tool driver
+# (ruff, dmypy) inherit it.
+_CHILD_ENV: Final[dict[str, str]] = {
+    **os.environ,
+    "PYTHONDONTWRITEBYTECODE": "1",
+    "PYTHONUNBUFFERED": "1",
+}
+
+# Algorithm number components in an implementation filename.
+_ALGO_FILE_RE: Final[re.Pattern[str]] = re.compile(r"^algorithm_(\d+)_(\d+)_.*\.py$")
+
+# Implementation files keyed by algorithm number.  Populated by one scan of
+# ALGO_DIR (_scan_algo_dir) before the checks start so no check re-scans it;
+# empty until that scan.
+_ALGO_FILES: dict[str, list[Path]] = {}
+
+# Per-algorithm results of the last run, keyed by a hash of the sources.  An
+# algorithm whose sources are unchanged since an all-green run is skipped.
+RESULT_CACHE_DIR: Final[Path] = Path.home() / ".cache" / "algo_completeness"
+
+# Precomputed tool results keyed by algorithm number, then tool name.  A tool
+# listed here is not re-run by the driver.  Populated by batch runs such as
+# run_checks_batch() before per-algorithm checks run.
+_PRESET_RESULTS: dict[str, dict[str, dict[str, Any]]] = {}
+
+# Bytes of driver stderr decoded when the driver itself fails.
+_ERROR_TAIL_BYTES: Final[int] = 4096
+
+# Tool-driver reports keyed by (algorithm number, file mtime hash), shared by
+# the tool checks.
+_DRIVER_RESULTS: dict[tuple[str, int], dict[str, dict[str, Any]]] = {}
+
+
+def _run_captured(check_func: Callable[[], bool]) -> tuple[bool, str]:
+    """Run a check with its printed output captured to a private buffer.
+
+    Args:
+        check_func: Zero-argument check returning True on success.
+
+    Returns:
+        Tuple of (check result, captured output).
+    """
+    buffer = io.StringIO()
+    with contextlib.redirect_stdout(buffer):
+        result = check_func()
+    return result, buffer.getvalue()
+
+
+def _algo_pattern(algo_num: str) -> str:
+    """Return the implementation filename glob for an algorithm number."""
+    return f"algorithm_{algo_num.replace('.', '_')}_*.py"
+
+
+def _test_path(algo_num: str) -> Path:
+    """Return the expected test module path for an algorithm number."""
+    return TESTS_DIR / f"test_algorithm_{algo_num.replace('.', '_')}.py"
+
+
+def _scan_algo_dir() -> None:
+    """Index every implementation file by algorithm number in one pass.
+
+    Uses a single ``os.scandir`` with plain string prefix/suffix tests:
+    no glob pattern compilation and no ``Path`` object for entries that do
+    not match.  Algorithms without files are indexed on demand by
+    _resolve_files().
+    """
+    found: dict[str, list[Path]] = {}
+    try:
+        with os.scandir(ALGO_DIR) as entries:
+            for entry in entries:
+                name = entry.name
+                if not (name.startswith("algorithm_") and name.endswith(".py")):
+                    continue
+                match = _ALGO_FILE_RE.match(name)
+                if match:
+                    found.setdefault(f"{match[1]}.{match[2]}", []).append(ALGO_DIR / name)
+    except FileNotFoundError:
+        pass
+
+    for paths in found.values():
+        paths.sort()
+    _ALGO_FILES.update(found)
+
+
+def _resolve_files(algo_num: str) -> list[Path]:
+    """Return the implementation files for an algorithm, scanning only once.
+
+    Args:
+        algo_num: Algorithm number in format "X.Y"
+
+    Returns:
+        Sorted list of matching implementation files (empty if none).
+    """
+    if not _ALGO_FILES:
+        _scan_algo_dir()
+    # Records algorithms without files too, so the index is never empty
+    # again and a missing algorithm does not trigger another scan.
+    return _ALGO_FILES.setdefault(algo_num, [])
+
+
+def _prewarm_bytecode() -> None:
+    """Compile the ``src`` package to bytecode if it has never been compiled.
+
+    Tool subprocesses run with ``PYTHONDONTWRITEBYTECODE`` and would
+    otherwise recompile every algorithm module they import on every run.
+    One parallel ``compileall`` pass the first time a checkout is checked
+    removes that cost from every later tool run.  Skipped when
+    ``src/algorithms/__pycache__`` exists; Python recompiles stale entries
+    itself.
+    """
+    if (ALGO_DIR / "__pycache__").exists():
+        return
+    # Syntax errors surface in the test and type checks; stay quiet here.
+    compileall.compile_dir(ALGO_DIR.parent, quiet=2, workers=0)
+
+
+def _discover_algorithms() -> list[str]:
+    """Discover every implemented algorithm with a single directory scan.
+
+    Returns:
+        Algorithm numbers in format "X.Y", in numeric order.
+    """
+    _scan_algo_dir()
+    implemented = [algo_num for algo_num, paths in _ALGO_FILES.items() if paths]
+    return sorted(implemented, key=lambda n: tuple(int(part) for part in n.split(".")))
+
 
 def check_implementation_exists(algo_num: str) -> bool:
     """Check if implementation file exists.
@@ -38,167 +187,331 @@ def check_implementation_exists(algo_num: str) -> bool:
     Returns:
         True if implementation exists, False otherwise
     """
-    algo_pattern = f"algorithm_{algo_num.replace('.', '_')}_*.py"
-    algo_dir = PROJECT_ROOT / "src" / "algorithms"
-
-    matches = list(algo_dir.glob(algo_pattern))
+    matches = _resolve_files(algo_num)
 
     if not matches:
-        print(f"  ✗ Implementation file not found (expected: {algo_pattern})")
+        print(f"  ✗ Implementation file not found (expected: {_algo_pattern(algo_num)})")
         return False
 
     print(f"  ✓ Implementation exists: {matches[0].name}")
     return True
 
 
-def check_tests_pass(algo_num: str) -> bool:
-    """Check if tests pass.
+@dataclass(frozen=True, slots=True)
+class CheckSpec:
+    """Declarative description of one tool check run through the driver.
+
+    Attributes:
+        name: Short check name, used in error messages and as the cache key.
+        title: Numbered heading printed in the report, e.g. "2. Tests pass".
+        tool: Tool name in the driver report ("pytest", "mypy", "ruff").
+        argv_template: File placeholders passed to the driver after
+            ``--<tool>``: "{impl}" expands to every implementation file,
+            "{impl0}" to the first one and "{test}" to the test module when
+            it exists.
+        parse_success: Builds the success message from the tool output.
+        missing: Message printed when the template expands to no files;
+            may reference ``{test_name}``.
+        failure_header: Message printed on failure; may reference
+            ``{returncode}``.
+        failure_lines: Trailing output lines shown on failure (None = all).
+    """
+
+    name: str
+    title: str
+    tool: str
+    argv_template: tuple[str, ...]
+    parse_success: Callable[[str], str]
+    missing: str
+    failure_header: str
+    failure_lines: int | None = None
+
+
+def _pytest_success(output: str) -> str:
+    """Extract the test count from pytest's summary line."""
+    for line in output.split("\n"):
+        if "passed" in line:
+            return f"Tests pass: {line.strip()}"
+    return "Tests pass"
+
+
+# Tool checks in report order.  Each runs through the shared tool driver.
+CHECK_SPECS: Final[tuple[CheckSpec, ...]] = (
+    CheckSpec(
+        name="tests",
+        title="2. Tests pass",
+        tool="pytest",
+        argv_template=("{test}",),
+        parse_success=_pytest_success,
+        missing="Test file not found: {test_name}",
+        failure_header="Tests failed (exit code: {returncode})",
+        failure_lines=10,
+    ),
+    CheckSpec(
+        name="mypy",
+        title="3. Mypy clean",
+        tool="mypy",
+        argv_template=("{impl0}",),
+        parse_success=lambda _: "Mypy clean (no type errors)",
+        missing="Implementation not found for mypy check",
+        failure_header="Mypy found type errors:",
+    ),
+    CheckSpec(
+        name="ruff",
+        title="4. Ruff clean",
+        tool="ruff",
+        argv_template=("{impl}", "{test}"),
+        parse_success=lambda _: "Ruff clean (all checks passed)",
+        missing="Implementation not found for ruff check",
+        failure_header="Ruff found linting issues:",
+    ),
+)
+_SPECS_BY_NAME: Final[dict[str, CheckSpec]] = {spec.name: spec for spec in CHECK_SPECS}
+
+
+def _expand_files(spec: CheckSpec, algo_num: str) -> list[str]:
+    """Expand a check's argv template into the files it runs on.
 
     Args:
+        spec: Check to expand.
         algo_num: Algorithm number in format "X.Y"
 
     Returns:
-        True if tests pass, False otherwise
+        File paths, empty when the files the check needs do not exist.
     """
-    test_file = f"test_algorithm_{algo_num.replace('.', '_')}.py"
-    test_path = PROJECT_ROOT / "tests" / test_file
+    impl_files = [str(f) for f in _resolve_files(algo_num)]
+    test_path = _test_path(algo_num)
+    expansions = {
+        "{impl}": impl_files,
+        "{impl0}": impl_files[:1],
+        "{test}": [str(test_path)] if test_path.exists() else [],
+    }
+    return [path for placeholder in spec.argv_template for path in expansions[placeholder]]
 
-    if not test_path.exists():
-        print(f"  ✗ Test file not found: {test_file}")
-        return False
 
-    # Check for virtual environment
-    venv_python = PROJECT_ROOT / ".venv" / "bin" / "python3"
-    python_cmd = str(venv_python) if venv_python.exists() else sys.executable
+def _files_mtime_hash(algo_num: str) -> int:
+    """Hash the paths and modification times of an algorithm's files.
+
+    Used as a cache key, so results are reused until the implementation or
+    its test module changes.
+
+    Args:
+        algo_num: Algorithm number in format "X.Y"
+
+    Returns:
+        Hash of (path, mtime) for every implementation file and the test module.
+    """
+    test_path = _test_path(algo_num)
+    stamps = [(str(p), p.stat().st_mtime_ns) for p in _resolve_files(algo_num)]
+    stamps.append((str(test_path), test_path.stat().st_mtime_ns if test_path.exists() else -1))
+    return hash(tuple(stamps))
+
+
+def _invoke_driver(tool_args: list[str]) -> dict[str, dict[str, Any]]:
+    """Run ``scripts/run_checks.py`` and parse its JSON report.
+
+    Args:
+        tool_args: Driver arguments (``--pytest FILE...`` and so on).
+
+    Returns:
+        Mapping of tool name to its result dict.
+
+    Raises:
+        RuntimeError: If the driver does not produce a JSON report.
+    """
+    result = subprocess.run(
+        [PYTHON_CMD, str(PROJECT_ROOT / "scripts" / "run_checks.py"), *tool_args],
+        cwd=PROJECT_ROOT,
+        env=_CHILD_ENV,
+        capture_output=True,
+        check=False,
+    )
 
+    # The report is the last line; anything a tool leaked to stdout
+    # precedes it.  json.loads() takes bytes, so stdout is never decoded
+    # as a whole.
+    last_line = result.stdout.rstrip().rpartition(b"\n")[2]
     try:
-        result = subprocess.run(
-            [python_cmd, "-m", "pytest", str(test_path), "-v"],
-            cwd=PROJECT_ROOT,
-            capture_output=True,
-            text=True,
-            check=False,
-        )
-
-        if result.returncode == 0:
-            # Extract test count from pytest output
-            for line in result.stdout.split("\n"):
-                if "passed" in line:
-                    print(f"  ✓ Tests pass: {line.strip()}")
-                    break
-            else:
-                print("  ✓ Tests pass")
-            return True
-        else:
-            print(f"  ✗ Tests failed (exit code: {result.returncode})")
-            # Show last few lines of output for debugging
-            error_lines = result.stdout.split("\n")[-10:]
-            for line in error_lines:
-                if line.strip():
-                    print(f"    {line}")
-            return False
+        report: dict[str, dict[str, Any]] = json.loads(last_line)
+    except json.JSONDecodeError as e:
+        raw_tail: bytes = result.stderr.rstrip()[-_ERROR_TAIL_BYTES:]
+        stderr_tail = raw_tail.decode("utf-8", errors="replace")
+        detail = stderr_tail.rpartition("\n")[2] if stderr_tail else str(e)
+        raise RuntimeError(f"tool driver failed: {detail}") from e
+    return report
 
-    except Exception as e:
-        print(f"  ✗ Error running tests: {e}")
-        return False
 
+def _run_tool_driver(algo_num: str, files_key: int) -> dict[str, dict[str, Any]]:
+    """Run every tool check for an algorithm in one driver subprocess.
 
-def check_mypy_clean(algo_num: str) -> bool:
-    """Check if mypy type checking passes.
+    The tool checks share a single ``scripts/run_checks.py`` process per
+    algorithm, so interpreter startup and tool imports are paid once instead
+    of three times.  Later checks of the same algorithm reuse the first
+    run's report.  Tools with a precomputed result (see
+    run_checks_batch()) are left out of the driver run.
 
     Args:
         algo_num: Algorithm number in format "X.Y"
+        files_key: Value of _files_mtime_hash() for the algorithm.
 
     Returns:
-        True if mypy passes, False otherwise
+        Mapping of tool name ("pytest", "mypy", "ruff") to a dict with
+        ``returncode`` and ``output`` keys.
+
+    Raises:
+        RuntimeError: If the driver does not produce a JSON report.
     """
-    algo_pattern = f"algorithm_{algo_num.replace('.', '_')}_*.py"
-    algo_dir = PROJECT_ROOT / "src" / "algorithms"
+    if (algo_num, files_key) in _DRIVER_RESULTS:
+        return _DRIVER_RESULTS[(algo_num, files_key)]
 
-    matches = list(algo_dir.glob(algo_pattern))
+    tool_args: list[str] = []
+    preset = _PRESET_RESULTS.get(algo_num, {})
+    for spec in CHECK_SPECS:
+        files = _expand_files(spec, algo_num)
+        if files and spec.tool not in preset:
+            tool_args += [f"--{spec.tool}", *files]
 
-    if not matches:
-        print("  ✗ Implementation not found for mypy check")
-        return False
+    report = _invoke_driver(tool_args)
+    _DRIVER_RESULTS[(algo_num, files_key)] = report
+    return report
 
-    # Check for virtual environment
-    venv_python = PROJECT_ROOT / ".venv" / "bin" / "python3"
-    python_cmd = str(venv_python) if venv_python.exists() else sys.executable
 
-    try:
-        result = subprocess.run(
-            [python_cmd, "-m", "mypy", str(matches[0])],
-            cwd=PROJECT_ROOT,
-            capture_output=True,
-            text=True,
-            check=False,
-        )
-
-        if result.returncode == 0:
-            print("  ✓ Mypy clean (no type errors)")
-            return True
-        else:
-            print("  ✗ Mypy found type errors:")
-            for line in result.stdout.split("\n"):
-                if line.strip():
-                    print(f"    {line}")
-            return False
+@functools.cache
+def _check_outcome(spec_name: str, algo_num: str, files_key: int) -> tuple[bool, tuple[str, ...]]:
+    """Evaluate one tool check and format its report lines.
 
-    except Exception as e:
-        print(f"  ✗ Error running mypy: {e}")
-        return False
+    Cached on the algorithm's file mtimes, so repeated checks of unchanged
+    files in the same process reuse the result.  Exceptions are not cached.
+
+    Args:
+        spec_name: Name of the check in CHECK_SPECS.
+        algo_num: Algorithm number in format "X.Y"
+        files_key: Value of _files_mtime_hash() for the algorithm.
+
+    Returns:
+        Tuple of (check passed, report lines).
+    """
+    spec = _SPECS_BY_NAME[spec_name]
+    result = _PRESET_RESULTS.get(algo_num, {}).get(spec.tool)
+    if result is None:
+        result = _run_tool_driver(algo_num, files_key)[spec.tool]
+    output: str = result["output"]
+
+    if result["returncode"] == 0:
+        return True, (f"  ✓ {spec.parse_success(output)}",)
+
+    lines = [f"  ✗ {spec.failure_header.format(returncode=result['returncode'])}"]
+    output_lines = output.split("\n")
+    if spec.failure_lines is not None:
+        output_lines = output_lines[-spec.failure_lines :]
+    lines += [f"    {line}" for line in output_lines if line.strip()]
+    return False, tuple(lines)
 
 
-def check_ruff_clean(algo_num: str) -> bool:
-    """Check if ruff linting passes.
+def run_check(spec: CheckSpec, algo_num: str) -> bool:
+    """Run one tool check for an algorithm and print its result.
 
     Args:
+        spec: Check to run.
         algo_num: Algorithm number in format "X.Y"
 
     Returns:
-        True if ruff passes, False otherwise
+        True if the check passes, False otherwise
     """
-    algo_pattern = f"algorithm_{algo_num.replace('.', '_')}_*.py"
-    test_pattern = f"test_algorithm_{algo_num.replace('.', '_')}.py"
+    if not _expand_files(spec, algo_num):
+        print(f"  ✗ {spec.missing.format(test_name=_test_path(algo_num).name)}")
+        return False
 
-    algo_dir = PROJECT_ROOT / "src" / "algorithms"
-    test_dir = PROJECT_ROOT / "tests"
+    try:
+        passed, lines = _check_outcome(spec.name, algo_num, _files_mtime_hash(algo_num))
+    except Exception as e:
+        print(f"  ✗ Error running {spec.name}: {e}")
+        return False
 
-    algo_matches = list(algo_dir.glob(algo_pattern))
-    test_matches = list(test_dir.glob(test_pattern))
+    for line in lines:
+        print(line)
+    return passed
 
-    if not algo_matches:
-        print("  ✗ Implementation not found for ruff check")
-        return False
 
-    files_to_check = [str(m) for m in algo_matches + test_matches]
+@functools.lru_cache(maxsize=4)
+def _registered_modules(init_file: Path, mtime_ns: int) -> frozenset[str]:
+    """Parse __init__.py once and collect the algorithm modules it references.
 
-    # Check for virtual environment
-    venv_python = PROJECT_ROOT / ".venv" / "bin" / "python3"
-    python_cmd = str(venv_python) if venv_python.exists() else sys.executable
+    A module counts as registered when it is imported (``from .algorithm_X
+    import ...``) or named as a string in the lazy-export table
+    (``".algorithm_X"``).  Comments and docstrings never match.  Cached on
+    the file's mtime, so checking many algorithms parses the file once.
 
-    try:
-        result = subprocess.run(
-            [python_cmd, "-m", "ruff", "check"] + files_to_check,
-            cwd=PROJECT_ROOT,
-            capture_output=True,
-            text=True,
-            check=False,
-        )
-
-        if result.returncode == 0:
-            print("  ✓ Ruff clean (all checks passed)")
-            return True
+    Args:
+        init_file: Path to the package ``__init__.py``.
+        mtime_ns: Modification time of ``init_file``; part of the cache key.
+
+    Returns:
+        Module names without leading dots, e.g. "algorithm_2_2_readonly_detector".
+    """
+    tree = ast.parse(init_file.read_text(), filename=str(init_file))
+    modules: set[str] = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.ImportFrom) and node.module:
+            name = node.module
+        elif isinstance(node, ast.Constant) and isinstance(node.value, str):
+            name = node.value.lstrip(".")
+            if not name.isidentifier():
+                continue
         else:
-            print("  ✗ Ruff found linting issues:")
-            for line in result.stdout.split("\n"):
-                if line.strip():
-                    print(f"    {line}")
-            return False
+            continue
+        if name.startswith("algorithm_"):
+            modules.add(name)
+    return frozenset(modules)
 
-    except Exception as e:
-        print(f"  ✗ Error running ruff: {e}")
-        return False
+
+def run_checks_batch(algo_nums: list[str]) -> None:
+    """Run every tool check for many algorithms in one driver invocation.
+
+    pytest, mypy and ruff each run once over the files of all algorithms
+    instead of once per algorithm, so tool startup is paid once.  The driver
+    reports a result per input file (``--by-file``), which is mapped back to
+    the owning algorithm and stored as that algorithm's precomputed result;
+    run_check() then reads it without starting a driver of its own.
+
+    If the driver fails, nothing is stored and each algorithm falls back to
+    its own driver run.  mypy diagnostics in modules outside the checked
+    files (e.g. src/utils) are not attributed to any algorithm.
+
+    Args:
+        algo_nums: Algorithm numbers in format "X.Y"
+    """
+    owner: dict[Path, str] = {}
+    tool_args: list[str] = ["--by-file"]
+    for spec in CHECK_SPECS:
+        files: list[str] = []
+        for algo_num in algo_nums:
+            for path in _expand_files(spec, algo_num):
+                owner[Path(path).resolve()] = algo_num
+                files.append(path)
+        if files:
+            tool_args += [f"--{spec.tool}", *files]
+    if not owner:
+        return
+
+    try:
+        report = _invoke_driver(tool_args)
+    except RuntimeError:
+        return
+
+    for tool, tool_result in report.items():
+        merged: dict[str, dict[str, Any]] = {}
+        for path_str, file_result in tool_result.get("by_file", {}).items():
+            algo_num = owner[Path(path_str).resolve()]
+            if algo_num not in merged:
+                merged[algo_num] = dict(file_result)
+                continue
+            # Several files per algorithm (ruff): worst exit code, joined output
+            entry = merged[algo_num]
+            entry["returncode"] = max(entry["returncode"], file_result["returncode"])
+            entry["output"] = "\n".join(o for o in (entry["output"], file_result["output"]) if o)
+        for algo_num, entry in merged.items():
+            _PRESET_RESULTS.setdefault(algo_num, {})[tool] = entry
 
 
 def check_init_registration(algo_num: str) -> bool:
@@ -210,19 +523,18 @@ def check_init_registration(algo_num: str) -> bool:
     Returns:
         True if registered, False otherwise
     """
-    init_file = PROJECT_ROOT / "src" / "algorithms" / "__init__.py"
+    init_file = ALGO_DIR / "__init__.py"
 
     if not init_file.exists():
         print("  ✗ __init__.py not found")
         return False
 
     try:
-        content = init_file.read_text()
+        registered = _registered_modules(init_file, init_file.stat().st_mtime_ns)
 
-        # Look for algorithm import statement
         algo_module = f"algorithm_{algo_num.replace('.', '_')}_"
 
-        if algo_module in content:
+        if any(module.startswith(algo_module) for module in registered):
             print("  ✓ Registered in __init__.py")
             return True
         else:
@@ -230,47 +542,172 @@ def check_init_registration(algo_num: str) -> bool:
             return False
 
     except Exception as e:
-        print(f"  ✗ Error reading __init__.py: {e}")
+        print(f"  ✗ Error parsing __init__.py: {e}")
         return False
 
 
-def main() -> int:
-    """Run all completeness checks.
+# Tools whose versions are part of every cache key: an upgrade can change
+# check results for unchanged sources.
+_CACHE_KEY_TOOLS: Final[tuple[str, ...]] = ("pytest", "mypy", "ruff")
+
+
+@functools.cache
+def _shared_digest() -> bytes:
+    """Hash the inputs every algorithm's check results depend on.
+
+    Covers every Python file under ``src/`` (shared modules such as
+    src/utils and src/models, and the package ``__init__.py``), the test
+    fixtures, ``pyproject.toml`` (tool configuration) and the installed
+    tool versions.  Computed once per process.
 
     Returns:
-        Exit code: 0 if all pass, 1 if any fail
+        SHA-1 digest bytes.
     """
-    parser = argparse.ArgumentParser(
-        description="Check algorithm implementation completeness"
-    )
-    parser.add_argument(
-        "algorithm",
-        help='Algorithm number in format "X.Y" (e.g., "1.4", "2.2")',
+    digest = hashlib.sha1(usedforsecurity=False)
+    digest.update(PYTHON_CMD.encode())
+    for tool in _CACHE_KEY_TOOLS:
+        try:
+            version = importlib.metadata.version(tool)
+        except importlib.metadata.PackageNotFoundError:
+            version = ""
+        digest.update(f"{tool}={version}\n".encode())
+
+    paths = [
+        *sorted(ALGO_DIR.parent.rglob("*.py")),
+        *sorted(p for p in (TESTS_DIR / "fixtures").rglob("*") if p.is_file()),
+        PROJECT_ROOT / "pyproject.toml",
+    ]
+    for path in paths:
+        digest.update(path.relative_to(PROJECT_ROOT).as_posix().encode())
+        if path.exists():
+            digest.update(path.read_bytes())
+    return digest.digest()
+
+
+def _source_digest(algo_num: str) -> str:
+    """Hash the sources that determine an algorithm's check results.
+
+    Covers the algorithm's test module plus everything in _shared_digest():
+    all of ``src/``, ``pyproject.toml`` and the tool versions.
+
+    Args:
+        algo_num: Algorithm number in format "X.Y"
+
+    Returns:
+        Hex SHA-1 digest of the file contents.
+    """
+    digest = hashlib.sha1(_shared_digest(), usedforsecurity=False)
+    test_path = _test_path(algo_num)
+    digest.update(test_path.name.encode())
+    if test_path.exists():
+        digest.update(test_path.read_bytes())
+    return digest.hexdigest()
+
+
+def _cache_file(algo_num: str) -> Path:
+    """Return the result cache file for an algorithm number."""
+    return RESULT_CACHE_DIR / f"{algo_num}.json"
+
+
+def _cached_green(algo_num: str, digest: str) -> bool:
+    """Check whether the last run on identical sources passed every check.
+
+    Args:
+        algo_num: Algorithm number in format "X.Y"
+        digest: Current value of _source_digest() for the algorithm.
+
+    Returns:
+        True if the cached results match ``digest`` and are all green.
+    """
+    try:
+        cached = json.loads(_cache_file(algo_num).read_bytes())
+    except (OSError, ValueError):
+        return False
+    results = cached.get("results") if isinstance(cached, dict) else None
+    return (
+        cached.get("hash") == digest
+        and isinstance(results, dict)
+        and bool(results)
+        and all(results.values())
     )
-    args = parser.parse_args()
 
-    algo_num = args.algorithm
+
+def _store_results(algo_num: str, digest: str, results: dict[str, bool]) -> None:
+    """Record check results for the given source digest.
+
+    The file is replaced atomically; failing to write it is not an error.
+
+    Args:
+        algo_num: Algorithm number in format "X.Y"
+        digest: Value of _source_digest() the checks ran against.
+        results: Check name to pass/fail.
+    """
+    cache_file = _cache_file(algo_num)
+    tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        RESULT_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_file.write_text(json.dumps({"hash": digest, "results": results}))
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        tmp_file.unlink(missing_ok=True)
+
+
+def check_algorithm(algo_num: str, use_cache: bool = True) -> bool:
+    """Run all completeness checks for one algorithm and print the report.
+
+    Args:
+        algo_num: Algorithm number in format "X.Y"
+        use_cache: Skip the checks when the sources are unchanged since a
+            run in which every check passed.
+
+    Returns:
+        True if all checks pass, False otherwise
+    """
+    _resolve_files(algo_num)
+
+    digest = _source_digest(algo_num) if use_cache else None
+    if digest is not None and _cached_green(algo_num, digest):
+        print(f"Algorithm {algo_num}: ✓ cached (unchanged since last passing run)")
+        return True
 
     print(f"\n{'='*60}")
     print(f"Algorithm {algo_num} Completeness Check")
     print(f"{'='*60}\n")
 
-    # Run all 5 checks
-    checks = [
+    # Cheap filesystem probes run first; the expensive tool checks (pytest,
+    # mypy, ruff) only run once the implementation is known to exist.
+    probes: list[tuple[str, Callable[[], bool]]] = [
         ("1. Implementation exists", lambda: check_implementation_exists(algo_num)),
-        ("2. Tests pass", lambda: check_tests_pass(algo_num)),
-        ("3. Mypy clean", lambda: check_mypy_clean(algo_num)),
-        ("4. Ruff clean", lambda: check_ruff_clean(algo_num)),
         ("5. __init__.py registration", lambda: check_init_registration(algo_num)),
     ]
+    tool_checks: list[tuple[str, Callable[[], bool]]] = [
+        (spec.title, functools.partial(run_check, spec, algo_num)) for spec in CHECK_SPECS
+    ]
+
+    outcomes: dict[str, tuple[bool, str]] = {}
+    for check_name, check_func in probes:
+        outcomes[check_name] = _run_captured(check_func)
 
-    results = []
-    for check_name, check_func in checks:
+    # The tool checks share one driver run per algorithm (_run_tool_driver),
+    # which already overlaps ruff with pytest and mypy, so they run in turn.
+    for check_name, check_func in tool_checks:
+        if outcomes["1. Implementation exists"][0]:
+            outcomes[check_name] = _run_captured(check_func)
+        else:
+            outcomes[check_name] = (False, "  - SKIPPED (no implementation)\n")
+
+    # Replay output in check-number order
+    results: list[bool] = []
+    for check_name in sorted(outcomes):
+        result, output = outcomes[check_name]
         print(f"{check_name}:")
-        result = check_func()
+        print(output, end="")
         results.append(result)
         print()
 
+    if digest is not None:
+        _store_results(algo_num, digest, {name: result for name, (result, _) in outcomes.items()})
+
     # Summary
     print(f"{'='*60}")
     passed = sum(results)
@@ -279,11 +716,75 @@ def main() -> int:
     if passed == total:
         print(f"✓ ALL CHECKS PASSED ({passed}/{total})")
         print(f"{'='*60}\n")
-        return 0
+        return True
     else:
         print(f"✗ FAILED: {passed}/{total} checks passed")
         print(f"{'='*60}\n")
-        return 1
+        return False
+
+
+def main() -> int:
+    """Run all completeness checks.
+
+    Returns:
+        Exit code: 0 if all pass, 1 if any fail
+    """
+    parser = argparse.ArgumentParser(
+        description="Check algorithm implementation completeness"
+    )
+    parser.add_argument(
+        "algorithms",
+        nargs="*",
+        metavar="ALGORITHM",
+        help='Algorithm numbers in format "X.Y", space- or comma-separated (e.g., "1.4 2.2")',
+    )
+    parser.add_argument(
+        "--all",
+        action="store_true",
+        help="Check every algorithm found in src/algorithms/",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Re-run every check even if the sources are unchanged since a passing run",
+    )
+    args = parser.parse_args()
+
+    if args.all == bool(args.algorithms):
+        parser.error("specify either ALGORITHM(s) or --all")
+
+    if args.all:
+        algo_nums = _discover_algorithms()
+    else:
+        requested = [n for arg in args.algorithms for n in arg.split(",") if n]
+        algo_nums = list(dict.fromkeys(requested))
+
+    _prewarm_bytecode()
+
+    if len(algo_nums) > 1:
+        stale = [
+            algo_num
+            for algo_num in algo_nums
+            if args.no_cache or not _cached_green(algo_num, _source_digest(algo_num))
+        ]
+        if stale:
+            run_checks_batch(stale)
+
+    failed = [
+        algo_num
+        for algo_num in algo_nums
+        if not check_algorithm(algo_num, use_cache=not args.no_cache)
+    ]
+
+    if len(algo_nums) > 1:
+        print(f"{'='*60}")
+        if failed:
+            print(f"✗ {len(failed)}/{len(algo_nums)} algorithms incomplete: {', '.join(failed)}")
+        else:
+            print(f"✓ ALL {len(algo_nums)} ALGORITHMS COMPLETE")
+        print(f"{'='*60}\n")
+
+    return 1 if failed else 0
 
 
 if __name__ == "__main__":
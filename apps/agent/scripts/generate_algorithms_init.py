@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+"""Generate src/algorithms/__init__.py from the algorithm modules.
+
+The package ``__init__.py`` is a PEP 562 lazy-export table.  Instead of
+editing it by hand, each algorithm module declares its public names in
+``__all__`` and this script rebuilds the table.  Modules are read with
+``ast.parse`` only, so generating never imports an algorithm (or pandas).
+
+A module without ``__all__`` is not exported.  A name exported by two
+modules, or listed in ``__all__`` but not defined at module level, is an
+error.
+
+Usage:
+    python scripts/generate_algorithms_init.py          # rewrite __init__.py
+    python scripts/generate_algorithms_init.py --check  # exit 1 if out of date
+
+Exit codes:
+    0: __init__.py is up to date (or was rewritten)
+    1: __init__.py is out of date (--check) or a module's exports are invalid
+"""
+
+from __future__ import annotations
+
+import argparse
+import ast
+import re
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Final
+
+# Project root is parent of scripts/ directory
+PROJECT_ROOT: Final[Path] = Path(__file__).parent.parent
+
+ALGO_DIR: Final[Path] = PROJECT_ROOT / "src" / "algorithms"
+INIT_FILE: Final[Path] = ALGO_DIR / "__init__.py"
+
+# Algorithm number components in an implementation filename.
+_ALGO_FILE_RE: Final[re.Pattern[str]] = re.compile(r"^algorithm_(\d+)_(\d+)_.*\.py$")
+
+_HEADER: Final[str] = '''"""Algorithm implementations for license optimization.
+
+Exported algorithms:
+{algorithms}
+
+Exports are resolved lazily (PEP 562): importing this package does not
+import any algorithm module.  An algorithm module is imported on first
+access to one of its names, so ``from src.algorithms import X`` only pays
+for the module that defines ``X``.
+
+Generated by scripts/generate_algorithms_init.py from each module's
+``__all__``; do not edit by hand.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import Any
+
+# Exported name -> defining submodule (relative to this package).
+_LAZY: dict[str, str] = {{
+{entries}
+}}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name: str) -> Any:
+    """Import the defining algorithm module on first access to an export."""
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {{__name__!r}} has no attribute {{name!r}}") from None
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    # Cache on the package so later lookups bypass __getattr__.
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *__all__])
+'''
+
+
+@dataclass(frozen=True, slots=True)
+class AlgorithmExports:
+    """Public names declared by one algorithm module.
+
+    Attributes:
+        number: Algorithm number in format "X.Y".
+        title: First line of the module docstring, without the final period.
+        module: Module name, e.g. "algorithm_2_2_readonly_detector".
+        names: Contents of the module's ``__all__``, in declaration order.
+    """
+
+    number: str
+    title: str
+    module: str
+    names: tuple[str, ...]
+
+
+def _defined_names(tree: ast.Module) -> set[str]:
+    """Collect the names bound at module level (defs, classes, assignments, imports)."""
+    names: set[str] = set()
+    for node in tree.body:
+        if isinstance(node, ast.FunctionDef | ast.AsyncFunctionDef | ast.ClassDef):
+            names.add(node.name)
+        elif isinstance(node, ast.Assign):
+            names.update(t.id for t in node.targets if isinstance(t, ast.Name))
+        elif isinstance(node, ast.AnnAssign) and isinstance(node.target, ast.Name):
+            names.add(node.target.id)
+        elif isinstance(node, ast.Import | ast.ImportFrom):
+            names.update((alias.asname or alias.name).split(".")[0] for alias in node.names)
+    return names
+
+
+def read_exports(path: Path) -> AlgorithmExports | None:
+    """Read an algorithm module's ``__all__`` without importing it.
+
+    Args:
+        path: Algorithm module file.
+
+    Returns:
+        The module's exports, or None if it is not an algorithm module or
+        does not declare ``__all__``.
+
+    Raises:
+        ValueError: If ``__all__`` is not a literal list of strings or names
+            an undefined attribute.
+    """
+    match = _ALGO_FILE_RE.match(path.name)
+    if match is None:
+        return None
+
+    tree = ast.parse(path.read_bytes(), filename=str(path))
+    declared: ast.expr | None = None
+    for node in tree.body:
+        if isinstance(node, ast.Assign):
+            targets = node.targets
+        elif isinstance(node, ast.AnnAssign):
+            targets = [node.target]
+        else:
+            continue
+        if any(isinstance(t, ast.Name) and t.id == "__all__" for t in targets):
+            declared = node.value
+    if declared is None:
+        return None
+
+    try:
+        names = ast.literal_eval(declared)
+    except ValueError:
+        names = None
+    if not isinstance(names, list | tuple) or not all(isinstance(n, str) for n in names):
+        raise ValueError(f"{path.name}: __all__ must be a literal list of strings")
+
+    undefined = sorted(set(names) - _defined_names(tree))
+    if undefined:
+        raise ValueError(f"{path.name}: __all__ names undefined attributes: {undefined}")
+
+    docstring = ast.get_docstring(tree) or ""
+    first_line = docstring.strip().split("\n", 1)[0].strip().rstrip(".")
+    number = f"{match[1]}.{match[2]}"
+    return AlgorithmExports(
+        number=number,
+        title=first_line or f"Algorithm {number}",
+        module=path.stem,
+        names=tuple(names),
+    )
+
+
+def collect_exports(algo_dir: Path = ALGO_DIR) -> list[AlgorithmExports]:
+    """Read the exports of every algorithm module, in algorithm-number order.
+
+    Args:
+        algo_dir: Directory containing the algorithm modules.
+
+    Returns:
+        Exports of each module that declares ``__all__``.
+
+    Raises:
+        ValueError: If a module's exports are invalid or a name is exported
+            by more than one module.
+    """
+    exports = [e for path in algo_dir.glob("algorithm_*_*.py") if (e := read_exports(path))]
+    exports.sort(key=lambda e: (tuple(int(part) for part in e.number.split(".")), e.module))
+
+    owner: dict[str, str] = {}
+    for algo in exports:
+        for name in algo.names:
+            if name in owner:
+                raise ValueError(f"{name!r} is exported by both {owner[name]} and {algo.module}")
+            owner[name] = algo.module
+    return exports
+
+
+def render_init(exports: list[AlgorithmExports]) -> str:
+    """Render the package ``__init__.py`` source.
+
+    Args:
+        exports: Module exports, in the order they should appear.
+
+    Returns:
+        Source text of the generated module.
+    """
+    algorithms = "\n".join(f"  - {algo.title}" for algo in exports)
+    entries: list[str] = []
+    for algo in exports:
+        entries.append(f"    # Algorithm {algo.number}")
+        entries.extend(f'    "{name}": ".{algo.module}",' for name in algo.names)
+    return _HEADER.format(algorithms=algorithms, entries="\n".join(entries))
+
+
+def main() -> int:
+    """Regenerate (or verify) src/algorithms/__init__.py.
+
+    Returns:
+        Exit code: 0 if up to date or rewritten, 1 otherwise
+    """
+    parser = argparse.ArgumentParser(description="Generate src/algorithms/__init__.py")
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Do not write; exit 1 if __init__.py differs from the generated output",
+    )
+    args = parser.parse_args()
+
+    try:
+        content = render_init(collect_exports())
+    except (ValueError, SyntaxError) as e:
+        print(f"✗ {e}", file=sys.stderr)
+        return 1
+
+    current = INIT_FILE.read_text() if INIT_FILE.exists() else ""
+    if content == current:
+        print(f"✓ {INIT_FILE.relative_to(PROJECT_ROOT)} is up to date")
+        return 0
+
+    if args.check:
+        print(
+            f"✗ {INIT_FILE.relative_to(PROJECT_ROOT)} is out of date; "
+            "run python scripts/generate_algorithms_init.py",
+            file=sys.stderr,
+        )
+        return 1
+
+    INIT_FILE.write_text(content)
+    print(f"✓ Wrote {INIT_FILE.relative_to(PROJECT_ROOT)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,430 @@
+#!/usr/bin/env python3
+"""Tool driver for the algorithm completeness checker.
+
+Runs pytest, mypy, and ruff over the given files inside a single Python
+process and prints a JSON report to stdout.  Spawning this driver once
+replaces three separate ``python -m <tool>`` launches, so interpreter
+startup and the heavy tool imports are paid only once per check run.
+
+pytest and mypy are driven through their in-process APIs
+(``pytest.main`` and ``mypy.api.run``).  ruff is a native binary, so it
+is started first as a subprocess and overlaps with the in-process tools.
+
+The caller resolves the files (see check_algorithm_completeness.py), so the
+driver never re-scans the source tree.
+
+Usage:
+    python scripts/run_checks.py \
+        --pytest tests/test_algorithm_2_2.py \
+        --mypy src/algorithms/algorithm_2_2_readonly_detector.py \
+        --ruff src/algorithms/algorithm_2_2_readonly_detector.py tests/test_algorithm_2_2.py
+
+Output (stdout, JSON):
+    {"pytest": {"returncode": 0, "output": "..."},
+     "mypy":   {"returncode": 0, "output": "..."},
+     "ruff":   {"returncode": 0, "output": "..."}}
+
+A tool is omitted from the report when it has no files to check.
+
+With ``--by-file`` each tool result also carries a ``by_file`` mapping of
+every input file to its own ``returncode`` and ``output``, so one driver
+run can check many algorithms at once.  pytest outcomes are tallied per
+test module by a plugin; mypy and ruff diagnostics are attributed by their
+``path:line`` prefix.
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import importlib.util
+import io
+import json
+import os
+import shutil
+import subprocess
+import sys
+from collections import Counter, defaultdict, deque
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, Any, Final
+
+if TYPE_CHECKING:
+    import pytest
+
+# Project root is parent of scripts/ directory
+PROJECT_ROOT: Final[Path] = Path(__file__).parent.parent
+
+# Explicit mypy cache location so incremental runs reuse it regardless of
+# the caller's working directory.
+MYPY_CACHE_DIR: Final[Path] = PROJECT_ROOT / ".mypy_cache"
+
+# Flags shared by the mypy daemon and the in-process fallback so both report
+# the same diagnostics.  Import following stays at mypy's default: the daemon
+# rejects --follow-imports=silent.
+_MYPY_FLAGS: Final[list[str]] = [
+    "--incremental",
+    "--cache-dir",
+    str(MYPY_CACHE_DIR),
+]
+
+# Only the tail of each tool's output is reported: the checker prints at most
+# the last lines of a failure, and pytest's summary line is at the very end.
+OUTPUT_TAIL_BYTES: Final[int] = 4096
+
+# Lines of streamed tool output retained while a tool runs; earlier lines are
+# dropped as they arrive instead of being buffered.
+OUTPUT_TAIL_LINES: Final[int] = 64
+
+# Set to any non-empty value to run pytest serially (e.g. when debugging a
+# test that misbehaves under xdist).
+NO_PARALLEL_ENV: Final[str] = "ALGO_CHECK_NO_PARALLEL"
+
+# Seconds of inactivity after which a daemon started by this driver exits.
+DMYPY_IDLE_TIMEOUT: Final[int] = 1800
+
+# pytest's exit code when no tests were collected.
+_PYTEST_NO_TESTS: Final[int] = 5
+
+ToolResult = dict[str, Any]
+
+
+def _tail(output: bytes | str, returncode: int) -> str:
+    """Reduce tool output to what the checker reports.
+
+    Subprocess output stays as bytes until this point.  For a clean exit only
+    the final summary is kept; for a failure the last ``OUTPUT_TAIL_BYTES``
+    are decoded, so large tracebacks are never decoded or copied in full.
+
+    Args:
+        output: Raw tool output.
+        returncode: Tool exit code.
+
+    Returns:
+        Decoded tail of the output.
+    """
+    if isinstance(output, str):
+        output = output.encode("utf-8", errors="replace")
+    if returncode == 0:
+        output = output.rstrip().rpartition(b"\n")[2]
+    return output[-OUTPUT_TAIL_BYTES:].decode("utf-8", errors="replace")
+
+
+class _TailWriter(io.TextIOBase):
+    """Write-only text stream that retains only the last lines written.
+
+    Used in place of ``io.StringIO`` when capturing verbose tool output, so
+    memory stays bounded by ``maxlen`` lines however much a failing run
+    prints.
+    """
+
+    def __init__(self, maxlen: int = OUTPUT_TAIL_LINES) -> None:
+        super().__init__()
+        self._lines: deque[str] = deque(maxlen=maxlen)
+        self._partial = ""
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, text: str) -> int:
+        if "\n" not in text:
+            self._partial += text
+            return len(text)
+        *complete, self._partial = (self._partial + text).split("\n")
+        self._lines.extend(complete)
+        return len(text)
+
+    def getvalue(self) -> str:
+        """Return the retained lines, including any unterminated last line."""
+        return "\n".join([*self._lines, self._partial])
+
+
+def _read_tail(stream: IO[bytes]) -> bytes:
+    """Read a stream to EOF, keeping only its last ``OUTPUT_TAIL_LINES`` lines."""
+    return b"".join(deque(stream, maxlen=OUTPUT_TAIL_LINES))
+
+
+def find_ruff() -> str | None:
+    """Locate the ruff binary installed alongside this interpreter."""
+    try:
+        from ruff.__main__ import find_ruff_bin  # type: ignore[import-untyped]
+
+        return str(find_ruff_bin())
+    except (ImportError, FileNotFoundError):
+        return shutil.which("ruff")
+
+
+def _start_ruff(files: list[Path], concise: bool = False) -> subprocess.Popen[bytes] | None:
+    """Start ``ruff check`` in the background.
+
+    Args:
+        files: Files to lint.
+        concise: Print one ``path:line:col: CODE message`` line per diagnostic.
+
+    Returns:
+        The running process, or None if ruff is not installed.
+    """
+    ruff_bin = find_ruff()
+    if ruff_bin is None:
+        return None
+    return subprocess.Popen(
+        [ruff_bin, "check", *(["--output-format=concise"] if concise else []), *map(str, files)],
+        cwd=PROJECT_ROOT,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+    )
+
+
+def _pytest_args(files: list[Path]) -> list[str]:
+    """Build the pytest argv for the check run.
+
+    The cache and coverage plugins are disabled because the checker only
+    needs pass/fail.  When pytest-xdist is installed, tests are sharded
+    across ``cpu_count - 2`` workers, one file per worker, unless the
+    ``ALGO_CHECK_NO_PARALLEL`` environment variable is set.
+    """
+    args = [*(str(f) for f in files), "-v", "-p", "no:cacheprovider", "-p", "no:cov"]
+    if not os.environ.get(NO_PARALLEL_ENV) and importlib.util.find_spec("xdist") is not None:
+        workers = max(1, (os.cpu_count() or 1) - 2)
+        args += ["-n", str(workers), "--dist=loadfile"]
+    return args
+
+
+class _FileOutcomes:
+    """pytest plugin that tallies test outcomes per test module.
+
+    Under xdist the controller re-fires the report hooks for every worker
+    report, so the tally also covers parallel runs.
+    """
+
+    def __init__(self) -> None:
+        self.passed: Counter[str] = Counter()
+        self.failures: defaultdict[str, list[str]] = defaultdict(list)
+
+    def pytest_runtest_logreport(self, report: pytest.TestReport) -> None:
+        module = report.nodeid.partition("::")[0]
+        if report.failed:
+            crash = getattr(report.longrepr, "reprcrash", None)
+            message = getattr(crash, "message", "").partition("\n")[0]
+            label = "FAILED" if report.when == "call" else "ERROR"
+            self.failures[module].append(
+                f"{label} {report.nodeid}" + (f" - {message}" if message else "")
+            )
+        elif report.passed and report.when == "call":
+            self.passed[module] += 1
+
+    def pytest_collectreport(self, report: pytest.CollectReport) -> None:
+        if report.failed:
+            self.failures[report.nodeid.partition("::")[0]].append(
+                f"ERROR collecting {report.nodeid}"
+            )
+
+    def result_for(self, module: str) -> ToolResult:
+        """Summarize one test module's outcomes like a pytest run of that file alone."""
+        failures = self.failures.get(module, [])
+        passed = self.passed[module]
+        if failures:
+            summary = f"{len(failures)} failed, {passed} passed"
+            return {"returncode": 1, "output": _tail("\n".join([*failures, summary]), 1)}
+        if passed:
+            return {"returncode": 0, "output": f"{passed} passed"}
+        return {"returncode": _PYTEST_NO_TESTS, "output": "no tests ran"}
+
+
+def _run_pytest(files: list[Path], by_file: bool = False) -> ToolResult:
+    """Run pytest in-process on the given test files."""
+    import pytest
+
+    outcomes = _FileOutcomes()
+    buffer = _TailWriter()
+    with contextlib.redirect_stdout(buffer):
+        returncode = int(pytest.main(_pytest_args(files), plugins=[outcomes]))
+    result: ToolResult = {"returncode": returncode, "output": _tail(buffer.getvalue(), returncode)}
+    if by_file:
+        # Node ids are relative to the rootdir, which is PROJECT_ROOT.
+        result["by_file"] = {
+            str(f): outcomes.result_for(f.resolve().relative_to(PROJECT_ROOT).as_posix())
+            for f in files
+        }
+    return result
+
+
+def _split_by_file(files: list[Path], output: bytes, returncode: int) -> dict[str, ToolResult]:
+    """Attribute ``path:line...`` diagnostics to the input file they refer to.
+
+    Args:
+        files: Files the tool was run on.
+        output: Raw tool output.
+        returncode: Tool exit code.
+
+    Returns:
+        Mapping of each input file to its own result.  A file with no
+        diagnostics passes, unless the tool itself failed (exit code above
+        1), in which case every file carries the tool's exit code and output.
+    """
+    if returncode > 1:
+        failed: ToolResult = {"returncode": returncode, "output": _tail(output, returncode)}
+        return {str(f): failed for f in files}
+
+    owner = {f.resolve(): str(f) for f in files}
+    diagnostics: dict[str, list[str]] = {str(f): [] for f in files}
+    for line in output.decode("utf-8", errors="replace").splitlines():
+        path_str, sep, _ = line.partition(":")
+        key = owner.get((PROJECT_ROOT / path_str).resolve()) if sep else None
+        if key is not None:
+            diagnostics[key].append(line)
+    results: dict[str, ToolResult] = {}
+    for key, lines in diagnostics.items():
+        if lines:
+            results[key] = {"returncode": 1, "output": _tail("\n".join(lines), 1)}
+        else:
+            results[key] = {"returncode": 0, "output": ""}
+    return results
+
+
+def _find_dmypy() -> str | None:
+    """Locate the mypy daemon client installed alongside this interpreter."""
+    local = Path(sys.executable).with_name("dmypy")
+    if local.exists():
+        return str(local)
+    return shutil.which("dmypy")
+
+
+def _run_dmypy(dmypy: str, files: list[Path]) -> tuple[int, bytes] | None:
+    """Type-check via the mypy daemon, starting it if it is not running.
+
+    A warm daemon keeps the analyzed program in memory between check runs,
+    so the edit-and-recheck loop skips mypy's import and AST build work.
+
+    Args:
+        dmypy: Path to the ``dmypy`` executable.
+        files: Source files to type-check.
+
+    Returns:
+        Exit code and raw output, or None if the daemon could not be used.
+    """
+    status = subprocess.run([dmypy, "status"], cwd=PROJECT_ROOT, capture_output=True, check=False)
+    if status.returncode != 0:
+        start = subprocess.run(
+            [dmypy, "start", "--timeout", str(DMYPY_IDLE_TIMEOUT), "--", *_MYPY_FLAGS],
+            cwd=PROJECT_ROOT,
+            capture_output=True,
+            check=False,
+        )
+        if start.returncode != 0:
+            return None
+
+    result = subprocess.run(
+        [dmypy, "run", "--", *_MYPY_FLAGS, *(str(f) for f in files)],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        check=False,
+    )
+    # Exit code 2 with no diagnostics means the daemon itself failed.
+    if result.returncode == 2 and not result.stdout.strip():
+        return None
+    return result.returncode, result.stdout + result.stderr
+
+
+def _run_mypy(files: list[Path], by_file: bool = False) -> ToolResult:
+    """Type-check the given files, preferring the mypy daemon.
+
+    Falls back to in-process ``mypy.api.run`` when ``dmypy`` is unavailable
+    or fails.  mypy runs in incremental mode against ``MYPY_CACHE_DIR``, so
+    repeat checks only re-analyze modules whose sources changed.  Passing
+    all files in one call shares a single cache warm-up across them.
+    """
+    daemon_result: tuple[int, bytes] | None = None
+    dmypy = _find_dmypy()
+    if dmypy is not None:
+        with contextlib.suppress(OSError):
+            daemon_result = _run_dmypy(dmypy, files)
+
+    if daemon_result is not None:
+        returncode, output = daemon_result
+    else:
+        from mypy import api
+
+        stdout, stderr, returncode = api.run([*_MYPY_FLAGS, *(str(f) for f in files)])
+        output = (stdout + stderr).encode("utf-8", errors="replace")
+
+    result: ToolResult = {"returncode": returncode, "output": _tail(output, returncode)}
+    if by_file:
+        result["by_file"] = _split_by_file(files, output, returncode)
+    return result
+
+
+def run_checks(
+    pytest_files: list[Path],
+    mypy_files: list[Path],
+    ruff_files: list[Path],
+    by_file: bool = False,
+) -> dict[str, ToolResult]:
+    """Run each tool over its files.
+
+    Args:
+        pytest_files: Test modules to run.
+        mypy_files: Source files to type-check.
+        ruff_files: Source and test files to lint.
+        by_file: Also report a separate result for every input file.
+
+    Returns:
+        Mapping of tool name to its return code and output.
+    """
+    results: dict[str, ToolResult] = {}
+
+    ruff_proc = _start_ruff(ruff_files, concise=by_file) if ruff_files else None
+
+    if pytest_files:
+        results["pytest"] = _run_pytest(pytest_files, by_file)
+    if mypy_files:
+        results["mypy"] = _run_mypy(mypy_files, by_file)
+
+    if ruff_proc is not None:
+        # stdout is a pipe (see _start_ruff).  Per-file attribution needs
+        # every diagnostic line, so by-file runs read it whole and only the
+        # reported outputs are tailed.
+        if ruff_proc.stdout is None:
+            ruff_output = b""
+        elif by_file:
+            ruff_output = ruff_proc.stdout.read()
+        else:
+            ruff_output = _read_tail(ruff_proc.stdout)
+        ruff_proc.wait()
+        results["ruff"] = {
+            "returncode": ruff_proc.returncode,
+            "output": _tail(ruff_output, ruff_proc.returncode),
+        }
+        if by_file:
+            results["ruff"]["by_file"] = _split_by_file(
+                ruff_files, ruff_output, ruff_proc.returncode
+            )
+    elif ruff_files:
+        results["ruff"] = {"returncode": 2, "output": "ruff executable not found"}
+        if by_file:
+            results["ruff"]["by_file"] = {str(f): results["ruff"] for f in ruff_files}
+
+    return results
+
+
+def main() -> int:
+    """Run the tools and print the JSON report.
+
+    Returns:
+        Exit code: always 0; per-tool status is carried in the report.
+    """
+    parser = argparse.ArgumentParser(description="Run pytest, mypy and ruff in one process")
+    parser.add_argument("--pytest", nargs="*", type=Path, default=[], help="Test files")
+    parser.add_argument("--mypy", nargs="*", type=Path, default=[], help="Files to type-check")
+    parser.add_argument("--ruff", nargs="*", type=Path, default=[], help="Files to lint")
+    parser.add_argument(
+        "--by-file", action="store_true", help="Also report a result for every input file"
+    )
+    args = parser.parse_args()
+
+    results = run_checks(args.pytest, args.mypy, args.ruff, args.by_file)
+    sys.stdout.write(json.dumps(results) + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,85 +1,100 @@
 """Algorithm implementations for license optimization.
 
 Exported algorithms:
-  Phase 1:
-  - Algorithm 2.2: Read-Only User Detector
-  - Algorithm 2.5: License Minority Detection
+  - Algorithm 1.1: Role License Composition Analyzer
+  - Algorithm 1.2: User Segment Analyzer
+  - Algorithm 1.4: Component Removal Recommender
+  - Algorithm 2.1: Permission vs. Usage Analyzer
+  - Algorithm 2.2: Read-Only User Detector (Enhanced)
+  - Algorithm 2.5: License Minority Detection & Optimization
   - Algorithm 3.3: Privilege Creep Detector
   - Algorithm 3.4: Toxic Combination Detector
+  - Algorithm 3.5: Orphaned Account Detector
   - Algorithm 3.6: Emergency Account Monitor
-  - Algorithm 4.7: New User License Recommender
+  - Algorithm 4.2: License Attach Optimizer
+  - Algorithm 4.7: New User License Recommendation Engine
   - Algorithm 5.3: Time-Based Access Analyzer
+
+Exports are resolved lazily (PEP 562): importing this package does not
+import any algorithm module.  An algorithm module is imported on first
+access to one of its names, so ``from src.algorithms import X`` only pays
+for the module that defines ``X``.
+
+Generated by scripts/generate_algorithms_init.py from each module's
+``__all__``; do not edit by hand.
 """
 
-from .algorithm_1_2_user_segment_analyzer import (
-    UserSegmentAnalysis,
-    UserSegmentDetail,
-    analyze_user_segments,
-from .algorithm_1_1_role_composition_analyzer import (
-    LicenseCompositionEntry,
-    RoleComposition,
-    analyze_role_composition,
-    analyze_roles_batch,
-from .algorithm_1_4_component_removal import (
-    ComponentRemovalCandidate,
-    ComponentRemovalResult,
-    recommend_component_removal,
-)
-from .algorithm_2_2_readonly_detector import detect_readonly_users
-from .algorithm_2_5_license_minority_detector import detect_license_minority_users
-from .algorithm_3_3_privilege_creep_detector import detect_privilege_creep
-from .algorithm_3_4_toxic_combination_detector import (
-    detect_toxic_combinations,
-    detect_toxic_combinations_batch,
-)
-from .algorithm_4_2_license_attach_optimizer import (
-    AttachOptimization,
-    AttachOptimizationResult,
-    optimize_license_attach,
-)
-from .algorithm_4_7_new_user_license_recommender import (
-    NewUserLicenseRecommender,
-    LicenseRecommendationOption,
-    suggest_license_for_new_user,
-)
-from .algorithm_5_3_time_based_access_analyzer import (
-    TimeBasedAccessAlert,
-    TimeBasedAccessAnalysis,
-    analyze_time_based_access,
-)
+from __future__ import annotations
+
+import importlib
+from typing import Any
+
+# Exported name -> defining submodule (relative to this package).
+_LAZY: dict[str, str] = {
+    # Algorithm 1.1
+    "LicenseCompositionEntry": ".algorithm_1_1_role_composition_analyzer",
+    "RoleComposition": ".algorithm_1_1_role_composition_analyzer",
+    "analyze_role_composition": ".algorithm_1_1_role_composition_analyzer",
+    "analyze_roles_batch": ".algorithm_1_1_role_composition_analyzer",
+    # Algorithm 1.2
+    "UserSegmentAnalysis": ".algorithm_1_2_user_segment_analyzer",
+    "UserSegmentDetail": ".algorithm_1_2_user_segment_analyzer",
+    "analyze_user_segments": ".algorithm_1_2_user_segment_analyzer",
+    "analyze_user_segments_batch": ".algorithm_1_2_user_segment_analyzer",
+    # Algorithm 1.4
+    "ComponentRemovalCandidate": ".algorithm_1_4_component_removal",
+    "ComponentRemovalResult": ".algorithm_1_4_component_removal",
+    "recommend_component_removal": ".algorithm_1_4_component_removal",
+    "recommend_component_removal_batch": ".algorithm_1_4_component_removal",
+    # Algorithm 2.1
+    "analyze_permission_usage": ".algorithm_2_1_permission_usage_analyzer",
+    # Algorithm 2.2
+    "detect_readonly_users": ".algorithm_2_2_readonly_detector",
+    # Algorithm 2.5
+    "detect_license_minority_users": ".algorithm_2_5_license_minority_detector",
+    # Algorithm 3.3
+    "detect_privilege_creep": ".algorithm_3_3_privilege_creep_detector",
+    # Algorithm 3.4
+    "detect_toxic_combinations": ".algorithm_3_4_toxic_combination_detector",
+    "detect_toxic_combinations_batch": ".algorithm_3_4_toxic_combination_detector",
+    # Algorithm 3.5
+    "OrphanType": ".algorithm_3_5_orphaned_account_detector",
+    "OrphanedAccountResult": ".algorithm_3_5_orphaned_account_detector",
+    "UserDirectoryRecord": ".algorithm_3_5_orphaned_account_detector",
+    "detect_orphaned_accounts": ".algorithm_3_5_orphaned_account_detector",
+    # Algorithm 3.6
+    "EmergencyAccountAlert": ".algorithm_3_6_emergency_account_monitor",
+    "EmergencyAccountAnalysis": ".algorithm_3_6_emergency_account_monitor",
+    "EmergencyAccountConfig": ".algorithm_3_6_emergency_account_monitor",
+    "monitor_emergency_accounts": ".algorithm_3_6_emergency_account_monitor",
+    # Algorithm 4.2
+    "AttachOptimization": ".algorithm_4_2_license_attach_optimizer",
+    "AttachOptimizationResult": ".algorithm_4_2_license_attach_optimizer",
+    "optimize_license_attach": ".algorithm_4_2_license_attach_optimizer",
+    # Algorithm 4.7
+    "LicenseRecommendationOption": ".algorithm_4_7_new_user_license_recommender",
+    "NewUserLicenseRecommender": ".algorithm_4_7_new_user_license_recommender",
+    "suggest_license_for_new_user": ".algorithm_4_7_new_user_license_recommender",
+    # Algorithm 5.3
+    "TimeBasedAccessAlert": ".algorithm_5_3_time_based_access_analyzer",
+    "TimeBasedAccessAnalysis": ".algorithm_5_3_time_based_access_analyzer",
+    "analyze_time_based_access": ".algorithm_5_3_time_based_access_analyzer",
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name: str) -> Any:
+    """Import the defining algorithm module on first access to an export."""
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    # Cache on the package so later lookups bypass __getattr__.
+    globals()[name] = value
+    return value
+
 
-__all__ = [
-    "UserSegmentAnalysis",
-    "UserSegmentDetail",
-    "analyze_user_segments",
-    # Phase 2
-    "detect_orphaned_accounts",
-    "OrphanedAccountResult",
-    "OrphanType",
-    "UserDirectoryRecord",
-    "analyze_permission_usage",
-    "LicenseCompositionEntry",
-    "RoleComposition",
-    "analyze_role_composition",
-    "analyze_roles_batch",
-    # Phase 2
-    "ComponentRemovalCandidate",
-    "ComponentRemovalResult",
-    "recommend_component_removal",
-    # Phase 1
-    "detect_readonly_users",
-    "detect_license_minority_users",
-    "detect_privilege_creep",
-    "detect_toxic_combinations",
-    "detect_toxic_combinations_batch",
-    "EmergencyAccountAlert",
-    "EmergencyAccountAnalysis",
-    "EmergencyAccountConfig",
-    "monitor_emergency_accounts",
-    "NewUserLicenseRecommender",
-    "LicenseRecommendationOption",
-    "suggest_license_for_new_user",
-    "TimeBasedAccessAlert",
-    "TimeBasedAccessAnalysis",
-    "analyze_time_based_access",
-]
+def __dir__() -> list[str]:
+    return sorted([*globals(), *__all__])
@@ -20,9 +20,18 @@ from __future__ import annotations
 
 from typing import Any
 
+import numpy as np
 import pandas as pd
 from pydantic import BaseModel, Field
 
+__all__ = [
+    "LicenseCompositionEntry",
+    "RoleComposition",
+    "analyze_role_composition",
+    "analyze_roles_batch",
+]
+
+
 # ---------------------------------------------------------------------------
 # Output Models
 # ---------------------------------------------------------------------------
@@ -82,6 +91,12 @@ _STANDARD_LICENSE_TYPES: list[str] = [
     "Team Members",
 ]
 
+# Position of each standard license type in a per-role counts array
+_LICENSE_TYPE_SLOTS: dict[str, int] = {lt: i for i, lt in enumerate(_STANDARD_LICENSE_TYPES)}
+
+# Slots a combined "Finance + SCM" item is counted in
+_COMBINED_SLOTS: list[int] = [_LICENSE_TYPE_SLOTS["Finance"], _LICENSE_TYPE_SLOTS["SCM"]]
+
 
 # ---------------------------------------------------------------------------
 # Public API
@@ -92,6 +107,7 @@ def analyze_role_composition(
     security_config: pd.DataFrame,
     role_name: str,
     pricing_config: dict[str, Any],
+    row_indices: np.ndarray | None = None,
 ) -> RoleComposition:
     """Analyze the license composition of a single security role.
 
@@ -111,55 +127,165 @@ def analyze_role_composition(
         role_name: Name of the security role to analyze.
         pricing_config: Parsed pricing.json dictionary (used for future
             extensibility; priority is read from the security config data).
+        row_indices: Optional positions of the role's rows in
+            security_config, in row order (e.g. from
+            ``security_config.groupby("securityrole").indices``).  When
+            given, the rows are taken positionally instead of comparing
+            every securityrole value against role_name.
 
     Returns:
         RoleComposition with full breakdown and highest license identification.
     """
     # Filter rows for the requested role
-    role_mask: pd.Series = security_config["securityrole"] == role_name  # type: ignore[assignment]
-    role_data: pd.DataFrame = security_config[role_mask]
+    role_data: pd.DataFrame
+    if row_indices is not None:
+        role_data = security_config.iloc[row_indices]
+    else:
+        role_mask: pd.Series = security_config["securityrole"] == role_name  # type: ignore[assignment]
+        role_data = security_config[role_mask]
 
     total_items: int = len(role_data)
 
-    # Initialize counts for all standard license types
-    license_counts: dict[str, int] = {lt: 0 for lt in _STANDARD_LICENSE_TYPES}
+    # Counts for all standard license types start at zero
+    license_counts: dict[str, int] = dict.fromkeys(_STANDARD_LICENSE_TYPES, 0)
 
     # Track the highest priority seen and its associated license type
     highest_priority: int = -1
     highest_license: str = "None"
 
     if total_items > 0:
-        # Vectorized: extract license types and priorities
-        license_types: pd.Series = role_data["LicenseType"]  # type: ignore[assignment]
-        priorities: pd.Series = role_data["Priority"]  # type: ignore[assignment]
-
-        # Process each row for combined license detection and counting
-        for license_type, priority in zip(license_types, priorities):
-            lt_str: str = str(license_type)
-            pri: int = int(priority)
-
-            # Handle combined licenses: "Finance + SCM" -> count in both
-            if "Finance" in lt_str and "SCM" in lt_str:
-                license_counts["Finance"] = license_counts.get("Finance", 0) + 1
-                license_counts["SCM"] = license_counts.get("SCM", 0) + 1
-                # Both Finance and SCM share the same priority (180),
-                # so track with either
-                if pri > highest_priority:
-                    highest_priority = pri
-                    highest_license = "Finance"
-            else:
-                license_counts[lt_str] = license_counts.get(lt_str, 0) + 1
-                if pri > highest_priority:
-                    highest_priority = pri
-                    highest_license = lt_str
-
-    # Build composition entries with percentages
+        # map(str) rather than astype(str): pandas 3 keeps missing values
+        # as NaN under astype(str), while str() yields "nan"
+        license_types: pd.Series = role_data["LicenseType"].map(str)
+
+        # Strings are encoded once; the scan itself runs on integer arrays.
+        # factorize numbers types in first-appearance order.
+        codes, uniques = pd.factorize(license_types)
+        combined_types: np.ndarray = _combined_license_codes(uniques)
+        type_counts, combined_count, top = _scan_license_codes(
+            codes,
+            combined_types,
+            role_data["Priority"].astype(int).to_numpy(dtype=np.int64),
+        )
+
+        license_counts = _tally_license_counts(uniques, type_counts, combined_count)
+
+        top_priority: int = int(role_data["Priority"].iloc[top])
+        if top_priority > highest_priority:
+            highest_priority = top_priority
+            # Both Finance and SCM share the same priority (180), so a
+            # combined license reports as Finance
+            top_code: int = int(codes[top])
+            highest_license = "Finance" if combined_types[top_code] else str(uniques[top_code])
+
+    return _build_role_composition(role_name, total_items, license_counts, highest_license)
+
+
+def _combined_license_codes(license_types: np.ndarray) -> np.ndarray:
+    """Flag the distinct license types that combine Finance and SCM.
+
+    The substring test runs once per distinct type (typically fewer than
+    ten) rather than once per menu item; index the result with the
+    factorized codes to get the per-item flags.
+
+    Args:
+        license_types: Distinct license-type strings (``pd.factorize`` uniques).
+
+    Returns:
+        Boolean array, True where the type names both Finance and SCM.
+    """
+    return np.array(["Finance" in lt and "SCM" in lt for lt in license_types], dtype=bool)
+
+
+def _tally_license_counts(
+    license_types: np.ndarray | pd.Index,
+    type_counts: np.ndarray,
+    combined_count: int,
+) -> dict[str, int]:
+    """Merge per-type counts into the composition counts for one role.
+
+    Standard license types are summed into a fixed-size int64 array by
+    slot; other types follow in the given order, skipping zero counts.
+
+    Args:
+        license_types: License-type strings the counts refer to.
+        type_counts: Non-combined item count per entry of license_types.
+        combined_count: Number of combined Finance + SCM items.
+
+    Returns:
+        Count per license type: the standard types first, then any others.
+    """
+    slots: np.ndarray = np.array(
+        [_LICENSE_TYPE_SLOTS.get(lt, -1) for lt in license_types], dtype=np.intp
+    )
+    standard: np.ndarray = np.zeros(len(_STANDARD_LICENSE_TYPES), dtype=np.int64)
+    # Handle combined licenses: "Finance + SCM" -> count in both
+    standard[_COMBINED_SLOTS] = combined_count
+    is_standard: np.ndarray = slots >= 0
+    np.add.at(standard, slots[is_standard], type_counts[is_standard])
+
+    license_counts: dict[str, int] = dict(zip(_STANDARD_LICENSE_TYPES, standard.tolist()))
+    others = np.asarray(license_types, dtype=object)[~is_standard]
+    for lt_str, count in zip(others, type_counts[~is_standard].tolist()):
+        if count:
+            license_counts[lt_str] = count
+    return license_counts
+
+
+def _scan_license_codes(
+    codes: np.ndarray,
+    combined_types: np.ndarray,
+    priorities: np.ndarray,
+) -> tuple[np.ndarray, int, int]:
+    """Count license-type codes and locate the highest priority.
+
+    The per-item work is one ``np.bincount`` histogram and one argmax;
+    combined types are then folded out of the histogram per code rather
+    than per item.
+
+    Args:
+        codes: License-type code per menu item (from ``pd.factorize``).
+        combined_types: True for each code whose type combines Finance and
+            SCM (see :func:`_combined_license_codes`).
+        priorities: Priority per menu item (int64).
+
+    Returns:
+        Tuple of (count per code, zero for combined codes; number of
+        combined items; position of the first item with the maximum
+        priority).
+    """
+    type_counts: np.ndarray = np.bincount(codes, minlength=len(combined_types))
+    combined_count: int = int(type_counts[combined_types].sum())
+    type_counts[combined_types] = 0
+    return type_counts, combined_count, int(priorities.argmax())
+
+
+def _build_role_composition(
+    role_name: str,
+    total_items: int,
+    license_counts: dict[str, int],
+    highest_license: str,
+) -> RoleComposition:
+    """Build the output model from per-license-type counts.
+
+    Args:
+        role_name: Name of the security role analyzed.
+        total_items: Number of menu items in the role.
+        license_counts: Menu item count per license type, in output order.
+        highest_license: Highest-cost license type, or 'None'.
+
+    Returns:
+        RoleComposition with percentages relative to total_items.
+    """
+    # Build composition entries with percentages.  Inputs are plain ints and
+    # strs computed by this module, so model_construct skips validation
+    # that cannot fail.
     composition: dict[str, LicenseCompositionEntry] = {}
     for lt, count in license_counts.items():
         pct: float = (count / total_items * 100.0) if total_items > 0 else 0.0
-        composition[lt] = LicenseCompositionEntry(count=count, percentage=pct)
+        composition[lt] = LicenseCompositionEntry.model_construct(count=count, percentage=pct)
 
-    return RoleComposition(
+    return RoleComposition.model_construct(
         algorithm_id="1.1",
         role_name=role_name,
         total_items=total_items,
@@ -178,6 +304,10 @@ def analyze_roles_batch(
     When role_names is None, discovers and analyzes ALL unique roles present
     in the security configuration data.
 
+    Produces the same results as calling analyze_role_composition() per
+    role, but groups the data once instead of re-filtering the whole
+    DataFrame for every role, so the cost is linear in rows plus roles.
+
     Args:
         security_config: DataFrame with security configuration data.
         pricing_config: Parsed pricing.json dictionary.
@@ -190,13 +320,96 @@ def analyze_roles_batch(
     if role_names is None:
         role_names = sorted(security_config["securityrole"].unique().tolist())
 
+    # Normalize the needed columns once, for the requested roles only
+    role_mask: pd.Series = security_config["securityrole"].isin(role_names)
+    selected: pd.DataFrame = security_config[role_mask]
+    priorities: np.ndarray = selected["Priority"].astype(int).to_numpy(dtype=np.int64)
+
+    # Encode roles and license types as integer codes (first-appearance
+    # order); missing roles get -1 and, as with groupby, are left out
+    role_codes, roles = pd.factorize(selected["securityrole"])
+    lt_codes, lts = pd.factorize(selected["LicenseType"].map(str))
+    combined_types: np.ndarray = _combined_license_codes(lts)
+    present: np.ndarray = role_codes >= 0
+    if not present.all():
+        role_codes, lt_codes = role_codes[present], lt_codes[present]
+        priorities = priorities[present]
+    counts, combined_counts, top_rows = _scan_role_codes(
+        role_codes, lt_codes, combined_types, priorities, len(roles)
+    )
+
+    # Each role's license types in first-appearance order within the role:
+    # order the (role, type) pairs by the row where each first occurs.
+    # Combined types are included but have zero counts, so tallying skips them.
+    pairs: np.ndarray = role_codes * len(lts) + lt_codes
+    unique_pairs, first_rows = np.unique(pairs, return_index=True)
+    type_order: dict[int, list[int]] = {}
+    for pair in unique_pairs[np.argsort(first_rows, kind="stable")].tolist():
+        role_code, lt_code = divmod(pair, len(lts))
+        type_order.setdefault(role_code, []).append(lt_code)
+
+    role_index: dict[Any, int] = {role: code for code, role in enumerate(roles)}
     results: list[RoleComposition] = []
     for name in role_names:
-        result: RoleComposition = analyze_role_composition(
-            security_config=security_config,
-            role_name=name,
-            pricing_config=pricing_config,
+        code: int | None = role_index.get(name)
+        if code is None:
+            empty_counts: dict[str, int] = dict.fromkeys(_STANDARD_LICENSE_TYPES, 0)
+            results.append(_build_role_composition(name, 0, empty_counts, "None"))
+            continue
+
+        combined_count: int = int(combined_counts[code])
+        role_types: np.ndarray = np.array(type_order.get(code, []), dtype=np.intp)
+        license_counts: dict[str, int] = _tally_license_counts(
+            lts[role_types], counts[code, role_types], combined_count
         )
-        results.append(result)
+        total_items: int = combined_count + int(counts[code].sum())
+
+        highest_license: str = "None"
+        top: int = int(top_rows[code])
+        # Same floor as analyze_role_composition (priorities above -1)
+        if priorities[top] > -1:
+            top_code: int = int(lt_codes[top])
+            highest_license = "Finance" if combined_types[top_code] else str(lts[top_code])
+
+        results.append(_build_role_composition(name, total_items, license_counts, highest_license))
 
     return results
+
+
+def _scan_role_codes(
+    role_codes: np.ndarray,
+    lt_codes: np.ndarray,
+    combined_types: np.ndarray,
+    priorities: np.ndarray,
+    n_roles: int,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Count license-type codes and locate the highest priority for every role.
+
+    Batch counterpart of :func:`_scan_license_codes`: a fixed number of
+    numpy reductions over the integer arrays covers all roles at once.
+
+    Args:
+        role_codes: Role code per menu item (from ``pd.factorize``).
+        lt_codes: License-type code per menu item (from ``pd.factorize``).
+        combined_types: True for each license-type code whose type combines
+            Finance and SCM (see :func:`_combined_license_codes`).
+        priorities: Priority per menu item (int64).
+        n_roles: Number of distinct role codes.
+
+    Returns:
+        Tuple of (counts[role, type], zero for combined types; combined item
+        count per role; position of each role's first item with its maximum
+        priority).  Every role code is assumed to occur at least once.
+    """
+    n_lts: int = len(combined_types)
+    counts: np.ndarray = np.bincount(
+        role_codes * n_lts + lt_codes, minlength=n_roles * n_lts
+    ).reshape(n_roles, n_lts)
+    combined_counts: np.ndarray = counts[:, combined_types].sum(axis=1)
+    counts[:, combined_types] = 0
+
+    # Sort by role, then priority descending, then position: the first row
+    # of each role in that order is its first row at the maximum priority
+    order: np.ndarray = np.lexsort((-priorities, role_codes))
+    _, starts = np.unique(role_codes[order], return_index=True)
+    return counts, combined_counts, order[starts]
@@ -27,10 +27,22 @@ Key behaviors:
 
 from __future__ import annotations
 
+from dataclasses import asdict, dataclass, field
 from datetime import UTC, datetime, timedelta
+from typing import Any
+
+import numpy as np
 import pandas as pd
 from pydantic import BaseModel, Field
 
+__all__ = [
+    "UserSegmentAnalysis",
+    "UserSegmentDetail",
+    "analyze_user_segments",
+    "analyze_user_segments_batch",
+]
+
+
 # ---------------------------------------------------------------------------
 # Canonical segment names
 # ---------------------------------------------------------------------------
@@ -83,29 +95,31 @@ class SegmentStats(BaseModel):
     )
 
 
-class UserSegmentDetail(BaseModel):
+@dataclass(frozen=True, slots=True, kw_only=True)
+class UserSegmentDetail:
     """Detailed per-user breakdown showing which licenses a user accessed.
 
+    One is allocated per user, so this is a slotted dataclass rather than a
+    pydantic model.  UserSegmentAnalysis still validates the list and
+    serializes each entry like a model.
+
     Attributes:
         user_id: User identifier.
         user_name: User display name (if available).
         segment: Segment the user was classified into.
-        licenses_used: Set of license types the user accessed.
+        licenses_used: Sorted license types the user accessed.
         activity_count: Number of activity records within the analysis window.
     """
 
-    user_id: str = Field(description="User identifier")
-    user_name: str | None = Field(default=None, description="User display name")
-    segment: str = Field(description="Assigned segment name")
-    licenses_used: list[str] = Field(
-        default_factory=list,
-        description="License types accessed by this user",
-    )
-    activity_count: int = Field(
-        default=0,
-        description="Number of activity records in the analysis window",
-        ge=0,
-    )
+    user_id: str
+    user_name: str | None = None
+    segment: str
+    licenses_used: list[str] = field(default_factory=list)
+    activity_count: int = 0
+
+    def model_dump(self) -> dict[str, Any]:
+        """Return the fields as a dict, like ``BaseModel.model_dump``."""
+        return asdict(self)
 
 
 class UserSegmentAnalysis(BaseModel):
@@ -152,19 +166,25 @@ def _build_menu_item_license_map(security_config: pd.DataFrame) -> dict[str, str
     Returns:
         Dict mapping AOTName -> LicenseType string.
     """
-    menu_license: dict[str, str] = {}
-    menu_priority: dict[str, int] = {}
-
-    for _, row in security_config.iterrows():
-        aot: str = str(row["AOTName"])
-        license_type: str = str(row["LicenseType"])
-        priority: int = int(row["Priority"])
-
-        if aot not in menu_license or priority > menu_priority[aot]:
-            menu_license[aot] = license_type
-            menu_priority[aot] = priority
-
-    return menu_license
+    if security_config.empty:
+        return {}
+
+    # map(str) rather than astype(str): pandas 3 keeps missing values as NaN
+    # under astype(str), while str() yields "nan"
+    config = pd.DataFrame(
+        {
+            "AOTName": security_config["AOTName"].map(str),
+            "LicenseType": security_config["LicenseType"].map(str),
+            "Priority": security_config["Priority"].astype(int),
+        }
+    )
+    # A stable descending sort keeps the first-listed row among equal
+    # priorities, so drop_duplicates(keep="first") picks the same winner
+    # as a row-by-row "strictly higher priority replaces" scan.
+    winners: pd.DataFrame = config.sort_values(
+        "Priority", ascending=False, kind="stable"
+    ).drop_duplicates("AOTName", keep="first")
+    return dict(zip(winners["AOTName"].to_numpy(), winners["LicenseType"].to_numpy()))
 
 
 def analyze_user_segments(
@@ -173,6 +193,9 @@ def analyze_user_segments(
     user_activity: pd.DataFrame,
     security_config: pd.DataFrame,
     analysis_days: int = 90,
+    menu_item_licenses: dict[str, str] | None = None,
+    return_detail: bool = True,
+    include_user_ids: bool = True,
 ) -> UserSegmentAnalysis:
     """Algorithm 1.2 -- Analyze user segments for a given role.
 
@@ -192,6 +215,15 @@ def analyze_user_segments(
         security_config: DataFrame with columns including
             ``securityrole``, ``AOTName``, ``LicenseType``, ``Priority``.
         analysis_days: Number of days of activity to consider (default 90).
+        menu_item_licenses: Optional precomputed menu item -> license type
+            map for security_config (see ``analyze_user_segments_batch``).
+            Built from security_config when omitted.
+        return_detail: Build the per-user ``detailed_breakdown`` (default
+            True). When False it is left empty and the per-user work
+            behind it is skipped.
+        include_user_ids: List each segment's ``user_ids`` (default True).
+            When False the lists are left empty; counts and percentages
+            are unaffected.
 
     Returns:
         UserSegmentAnalysis with segment counts, percentages, and
@@ -210,97 +242,121 @@ def analyze_user_segments(
 
     # Build a quick lookup of user_id -> user_name
     user_name_map: dict[str, str | None] = {}
-    if "user_name" in role_users.columns and not role_users.empty:
-        for _, row in role_users.iterrows():
-            user_name_map[str(row["user_id"])] = str(row["user_name"])
+    if return_detail and "user_name" in role_users.columns and not role_users.empty:
+        # Column arrays instead of iterrows: no per-row Series boxing.
+        # Missing values stringify as "nan", as they did via iterrows, and
+        # later rows win for duplicate user_ids.
+        user_name_map = dict(
+            zip(
+                map(str, role_users["user_id"].to_numpy(dtype=object, na_value=np.nan)),
+                map(str, role_users["user_name"].to_numpy(dtype=object, na_value=np.nan)),
+            )
+        )
 
     # -- Step 2: Build menu item -> license type map --
-    menu_item_licenses: dict[str, str] = _build_menu_item_license_map(
-        security_config
-    )
+    if menu_item_licenses is None:
+        menu_item_licenses = _build_menu_item_license_map(security_config)
 
     # -- Step 3: Filter activity to analysis window --
     cutoff: datetime = datetime.now(tz=UTC) - timedelta(days=analysis_days)
 
     if not user_activity.empty:
-        activity_df = user_activity.copy()
-        activity_df["_ts"] = pd.to_datetime(activity_df["timestamp"], utc=True)
-        activity_df = activity_df[activity_df["_ts"] >= cutoff]
+        # Select with a positional mask: no copy of the full frame and no
+        # helper column; only the rows inside the window are materialized.
+        timestamps = pd.to_datetime(user_activity["timestamp"], utc=True).array
+        # Compare the raw int64 ticks against the cutoff in the parsed unit,
+        # rounded up so that ">=" is unchanged.  NaT is the minimum int64,
+        # so it stays outside the window.
+        ns_per_tick = int(np.timedelta64(1, timestamps.unit) // np.timedelta64(1, "ns"))
+        cutoff_ticks: int = -(-pd.Timestamp(cutoff).value // ns_per_tick)
+        activity_df = user_activity[timestamps.asi8 >= cutoff_ticks]
     else:
         activity_df = user_activity
 
-    # -- Step 4: Classify each user --
-    # Initialize segment buckets
-    segment_users: dict[str, list[str]] = {name: [] for name in SEGMENT_NAMES}
-    detailed: list[UserSegmentDetail] = []
-
-    for uid in user_ids:
-        user_acts = activity_df[activity_df["user_id"] == uid]
-        act_count: int = len(user_acts)
-
-        if act_count == 0:
-            # Inactive -- no activity within window
-            segment_users["Inactive"].append(uid)
-            detailed.append(
-                UserSegmentDetail(
-                    user_id=uid,
-                    user_name=user_name_map.get(uid),
-                    segment="Inactive",
-                    licenses_used=[],
-                    activity_count=0,
-                )
-            )
-            continue
-
-        # Determine which license types the user actually accessed
-        licenses_used: set[str] = set()
-        for _, act in user_acts.iterrows():
-            menu_item: str = str(act["menu_item"])
-            # Prefer the security-config mapping; fall back to the
-            # license_tier column in the activity data itself.
-            if menu_item in menu_item_licenses:
-                licenses_used.add(menu_item_licenses[menu_item])
-            elif "license_tier" in act.index and pd.notna(act["license_tier"]):
-                licenses_used.add(str(act["license_tier"]))
-
-        # Classify based on license count
-        if len(licenses_used) == 1:
-            license_type = next(iter(licenses_used))
-            segment_name = _LICENSE_TO_SEGMENT.get(
-                license_type, f"{license_type}-Only"
+    # -- Step 4: Summarize activity per user in one grouped pass --
+    act_counts = pd.Series(dtype=np.int64)
+    license_counts = pd.Series(dtype=np.int64)
+    only_license = pd.Series(dtype=object)
+    licenses_by_user: dict[str, list[str]] = {}
+    if not activity_df.empty:
+        # Prefer the security-config mapping; fall back to the
+        # license_tier column in the activity data itself.
+        licenses = (
+            activity_df["menu_item"].map(str).map(menu_item_licenses).to_numpy(dtype=object)
+        )
+        if "license_tier" in activity_df.columns:
+            tiers = activity_df["license_tier"].to_numpy(dtype=object)
+            fallback = pd.isna(licenses) & pd.notna(tiers)
+            licenses[fallback] = [str(tier) for tier in tiers[fallback]]
+
+        act_counts = activity_df.groupby("user_id", sort=False).size()
+
+        # Distinct (user, license) pairs; rows with no license are dropped
+        used = (
+            pd.DataFrame({"user_id": activity_df["user_id"].to_numpy(), "license": licenses})
+            .dropna()
+            .drop_duplicates()
+        )
+        by_user = used.groupby("user_id", sort=False)["license"]
+        license_counts = by_user.size()
+        only_license = by_user.first()
+        if return_detail:
+            # Each user's distinct licenses, already sorted for the detail
+            licenses_by_user = (
+                used.sort_values("license", kind="stable")
+                .groupby("user_id", sort=False)["license"]
+                .agg(list)
+                .to_dict()
             )
-            # Ensure the segment exists in our canonical list
-            if segment_name not in segment_users:
-                segment_users[segment_name] = []
-            segment_users[segment_name].append(uid)
-        elif len(licenses_used) > 1:
-            segment_name = "Mixed-Usage"
-            segment_users["Mixed-Usage"].append(uid)
-        else:
-            # Edge case: activity exists but no license mapping found
-            segment_name = "Inactive"
-            segment_users["Inactive"].append(uid)
 
-        detailed.append(
+    # -- Step 5: Classify each user --
+    # Segments are assigned with array masks over all users at once:
+    # Inactive (no activity, or no license mapping found), Mixed-Usage
+    # (several license types) or "<LicenseType>-Only" (exactly one).
+    users = pd.Index(user_ids, dtype=object)
+    activity_counts: np.ndarray = act_counts.reindex(users, fill_value=0).to_numpy(np.int64)
+    n_licenses: np.ndarray = license_counts.reindex(users, fill_value=0).to_numpy(np.int64)
+    active: np.ndarray = activity_counts > 0
+
+    segment_of: np.ndarray = np.full(len(users), "Inactive", dtype=object)
+    segment_of[active & (n_licenses > 1)] = "Mixed-Usage"
+    single: np.ndarray = active & (n_licenses == 1)
+    if single.any():
+        single_license = only_license.reindex(users[single]).astype(object)
+        segment_of[single] = (
+            single_license.map(_LICENSE_TO_SEGMENT).fillna(single_license + "-Only").to_numpy()
+        )
+
+    detailed: list[UserSegmentDetail] = []
+    if return_detail:
+        detailed = [
             UserSegmentDetail(
                 user_id=uid,
                 user_name=user_name_map.get(uid),
                 segment=segment_name,
-                licenses_used=sorted(licenses_used),
+                licenses_used=licenses_by_user.get(uid, []),
                 activity_count=act_count,
             )
-        )
+            for uid, segment_name, act_count in zip(
+                user_ids, segment_of.tolist(), activity_counts.tolist()
+            )
+        ]
 
-    # -- Step 5: Calculate statistics --
+    # -- Step 6: Calculate statistics --
+    # Only SEGMENT_NAMES are reported; a non-canonical "<LicenseType>-Only"
+    # segment is kept in the user's detail but counted in no segment.
+    # Every field is produced here with its declared type, so
+    # model_construct skips validation that cannot fail.
+    user_array: np.ndarray = np.array(user_ids, dtype=object)
     segments: dict[str, SegmentStats] = {}
     for seg_name in SEGMENT_NAMES:
-        uid_list = segment_users.get(seg_name, [])
-        count = len(uid_list)
+        in_segment: np.ndarray = segment_of == seg_name
+        count = int(in_segment.sum())
         pct = (count / total_users * 100.0) if total_users > 0 else 0.0
-        segments[seg_name] = SegmentStats(
+        segments[seg_name] = SegmentStats.model_construct(
             count=count,
             percentage=round(pct, 2),
-            user_ids=uid_list,
+            user_ids=user_array[in_segment].tolist() if include_user_ids else [],
         )
 
     return UserSegmentAnalysis(
@@ -310,3 +366,59 @@ def analyze_user_segments(
         segments=segments,
         detailed_breakdown=detailed,
     )
+
+
+def analyze_user_segments_batch(
+    user_role_assignments: pd.DataFrame,
+    user_activity: pd.DataFrame,
+    security_config: pd.DataFrame,
+    role_names: list[str] | None = None,
+    analysis_days: int = 90,
+    return_detail: bool = True,
+    include_user_ids: bool = True,
+) -> list[UserSegmentAnalysis]:
+    """Analyze user segments for multiple roles in batch.
+
+    When role_names is None, discovers and analyzes ALL unique roles present
+    in the user-role assignments.
+
+    Produces the same results as calling analyze_user_segments() per role,
+    but builds the menu item -> license type map once for the whole batch
+    instead of once per role.
+
+    Args:
+        user_role_assignments: DataFrame with columns including
+            ``user_id``, ``user_name``, ``role_name``.
+        user_activity: DataFrame with columns including
+            ``user_id``, ``timestamp``, ``menu_item``, ``license_tier``.
+        security_config: DataFrame with columns including
+            ``securityrole``, ``AOTName``, ``LicenseType``, ``Priority``.
+        role_names: Roles to analyze. If None, all unique roles in
+            user_role_assignments are discovered and analyzed.
+        analysis_days: Number of days of activity to consider (default 90).
+        return_detail: Build each role's per-user ``detailed_breakdown``.
+        include_user_ids: List each segment's ``user_ids``.
+
+    Returns:
+        List of UserSegmentAnalysis results, one per role.
+    """
+    if role_names is None:
+        if "role_name" in user_role_assignments.columns:
+            role_names = sorted(user_role_assignments["role_name"].dropna().unique().tolist())
+        else:
+            role_names = []
+
+    menu_item_licenses: dict[str, str] = _build_menu_item_license_map(security_config)
+    return [
+        analyze_user_segments(
+            role_name=name,
+            user_role_assignments=user_role_assignments,
+            user_activity=user_activity,
+            security_config=security_config,
+            analysis_days=analysis_days,
+            menu_item_licenses=menu_item_licenses,
+            return_detail=return_detail,
+            include_user_ids=include_user_ids,
+        )
+        for name in role_names
+    ]
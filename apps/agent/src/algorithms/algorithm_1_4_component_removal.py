@@ -18,11 +18,25 @@ See Requirements/06-Algorithms-Decision-Logic.md, lines 302-382.
 
 from __future__ import annotations
 
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from typing import Any
 
+import numpy as np
 import pandas as pd
 from pydantic import BaseModel, Field
 
+from ..utils.frames import str_values
+from ..utils.role_index import select_role
+
+__all__ = [
+    "ComponentRemovalCandidate",
+    "ComponentRemovalResult",
+    "recommend_component_removal",
+    "recommend_component_removal_batch",
+]
+
 
 # ---------------------------------------------------------------------------
 # Constants
@@ -55,6 +69,9 @@ _IMPACT_HIGH_THRESHOLD: int = 10
 # Impact sort order for deterministic sorting.
 _IMPACT_ORDER: dict[str, int] = {"Low": 0, "Medium": 1, "High": 2}
 
+# Impact level for each sort rank (inverse of _IMPACT_ORDER).
+_IMPACT_LEVELS: np.ndarray = np.array(list(_IMPACT_ORDER), dtype=object)
+
 
 # ---------------------------------------------------------------------------
 # Output models
@@ -125,11 +142,11 @@ class ComponentRemovalResult(BaseModel):
 # ---------------------------------------------------------------------------
 
 
-def _assess_removal_impact(
-    menu_item: str,
-    users_affected: int,
-) -> tuple[str, bool]:
-    """Assess the impact of removing a menu item from a role.
+def _assess_removal_impacts(
+    menu_items: pd.Series,
+    users_affected: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Assess the impact of removing each of several menu items from a role.
 
     Impact is determined by two factors:
       1. Whether the item is a critical business operation (always High)
@@ -139,24 +156,25 @@ def _assess_removal_impact(
          - 10+ users:  High
 
     Args:
-        menu_item: The AOT name of the menu item.
-        users_affected: Number of users who accessed this item.
+        menu_items: AOT names of the menu items.
+        users_affected: Number of users who accessed each item, aligned
+            with ``menu_items``.
 
     Returns:
-        Tuple of (impact_level, requires_review).
-        Critical items always return ("High", True).
+        Tuple of (impact_ranks, requires_review) arrays aligned with the
+        inputs. Ranks follow ``_IMPACT_ORDER``; ``_IMPACT_LEVELS`` maps them
+        back to level names. Critical items are always (High, True).
     """
-    is_critical: bool = menu_item in CRITICAL_MENU_ITEMS
-
-    if is_critical:
-        return "High", True
-
-    if users_affected >= _IMPACT_HIGH_THRESHOLD:
-        return "High", False
-    elif users_affected >= _IMPACT_MEDIUM_THRESHOLD:
-        return "Medium", False
-    else:
-        return "Low", False
+    is_critical: np.ndarray = menu_items.isin(CRITICAL_MENU_ITEMS).to_numpy()
+    ranks: np.ndarray = np.select(
+        [
+            is_critical | (users_affected >= _IMPACT_HIGH_THRESHOLD),
+            users_affected >= _IMPACT_MEDIUM_THRESHOLD,
+        ],
+        [_IMPACT_ORDER["High"], _IMPACT_ORDER["Medium"]],
+        default=_IMPACT_ORDER["Low"],
+    )
+    return ranks, is_critical
 
 
 # ---------------------------------------------------------------------------
@@ -191,10 +209,16 @@ def recommend_component_removal(
         role_name: The security role to analyze.
         security_config: DataFrame with columns ``securityrole``, ``AOTName``,
             ``LicenseType``, etc. Maps roles to menu items and license types.
+            May be indexed by ``securityrole`` with
+            ``src.utils.role_index.build_role_index`` when analyzing many
+            roles, so the role's rows are found by index lookup.
         user_roles: DataFrame with columns ``user_id``, ``role_name``.
-            Maps users to their assigned roles.
+            Maps users to their assigned roles. May likewise be indexed
+            by ``role_name``.
         user_activity: DataFrame with columns ``user_id``, ``menu_item``,
             ``action``, etc. Records of user activity in the analysis period.
+            String columns of all three frames may be ``category`` dtype
+            (see ``src.utils.frames.as_categorical``).
         pricing_config: Parsed pricing.json dictionary. Currently used for
             future extensibility (savings estimation). Must contain a
             ``licenses`` key.
@@ -205,8 +229,9 @@ def recommend_component_removal(
         ComponentRemovalResult with removal candidates sorted by impact.
     """
     # Step 1: Get all users assigned to this role
-    role_users: pd.DataFrame = user_roles[user_roles["role_name"] == role_name]
-    user_ids: list[str] = role_users["user_id"].unique().tolist()
+    role_users: pd.DataFrame = select_role(user_roles, "role_name", role_name)
+    # Kept as a Series: isin takes it directly, no per-user Python list.
+    user_ids: pd.Series = role_users["user_id"].drop_duplicates()
     total_users: int = len(user_ids)
 
     # Handle empty role gracefully
@@ -219,9 +244,7 @@ def recommend_component_removal(
         )
 
     # Step 2: Get the role's menu items from security config
-    role_config: pd.DataFrame = security_config[
-        security_config["securityrole"] == role_name
-    ]
+    role_config: pd.DataFrame = select_role(security_config, "securityrole", role_name)
 
     # Deduplicate menu items (a role may reference the same AOT name
     # multiple times with different access levels).
@@ -243,45 +266,58 @@ def recommend_component_removal(
             expected_outcome="No high-license menu items in this role.",
         )
 
-    # Step 4: Pre-compute per-user menu item access from activity data.
+    # Step 4: Pre-compute per-item user counts from activity data.
     # Filter activity to only users in this role for efficiency.
     role_activity: pd.DataFrame = user_activity[
         user_activity["user_id"].isin(user_ids)
     ]
 
-    # Build a set of (user_id, menu_item) pairs for O(1) lookup.
-    if not role_activity.empty:
-        user_menu_pairs: set[tuple[str, str]] = set(
-            zip(
-                role_activity["user_id"].astype(str),
-                role_activity["menu_item"].astype(str),
-            )
-        )
-    else:
-        user_menu_pairs = set()
-
-    # Step 5: Evaluate each high-license item
-    removal_candidates: list[ComponentRemovalCandidate] = []
-
-    for _, row in high_license_items.iterrows():
-        aot_name: str = str(row["AOTName"])
-        license_type: str = str(row["LicenseType"])
+    # Distinct (user, item) pairs, then users per item.  Both columns are
+    # factorized to integer codes and each pair packed into one int64, so
+    # deduplication hashes plain integers rather than tuples.
+    # Records without a menu item cannot match any AOT name.
+    named_activity: pd.DataFrame = role_activity[role_activity["menu_item"].notna()]
+    item_codes, item_names = pd.factorize(str_values(named_activity["menu_item"]))
+    user_codes, _ = pd.factorize(named_activity["user_id"], use_na_sentinel=False)
+    n_items: int = len(item_names)
+    pairs: np.ndarray = pd.unique(user_codes.astype(np.int64) * n_items + item_codes)
+    users_per_item: pd.Series = pd.Series(
+        np.bincount(pairs % n_items if n_items else pairs, minlength=n_items),
+        index=item_names,
+    )
 
-        # Count how many role users accessed this item
-        users_who_used: int = sum(
-            1 for uid in user_ids if (uid, aot_name) in user_menu_pairs
-        )
+    # Step 5: Evaluate all high-license items at once; only the items below
+    # the threshold are visited to build candidates.
+    # Missing names stringify as "nan", as str() of a row value does
+    aot_names: pd.Series = pd.Series(str_values(high_license_items["AOTName"]))
+    users_used: np.ndarray = (
+        aot_names.map(users_per_item).fillna(0).to_numpy(dtype=np.int64)
+    )
+    # Compare counts against the threshold scaled to users once, rather than
+    # dividing every count; percentages are only needed for the candidates.
+    threshold_count: float = usage_threshold * total_users / 100.0
+    below: np.ndarray = users_used < threshold_count
 
-        # Calculate usage percentage
-        usage_pct: float = (users_who_used / total_users) * 100.0
+    # Assess impact of all candidates at once
+    candidate_names: pd.Series = aot_names[below]
+    candidate_users: np.ndarray = users_used[below]
+    candidate_pcts: np.ndarray = candidate_users / total_users * 100.0
+    ranks, reviews = _assess_removal_impacts(candidate_names, candidate_users)
 
-        # Check if below threshold
-        if usage_pct >= usage_threshold:
-            continue
+    # Step 6: Order by impact (Low first, then Medium, then High).  The sort
+    # is stable, so items of equal impact keep their configuration order.
+    order: np.ndarray = np.argsort(ranks, kind="stable")
 
-        # Assess impact
-        impact, requires_review = _assess_removal_impact(aot_name, users_who_used)
+    removal_candidates: list[ComponentRemovalCandidate] = []
 
+    for aot_name, license_type, users_who_used, usage_pct, impact, requires_review in zip(
+        candidate_names.to_numpy()[order].tolist(),
+        str_values(high_license_items["LicenseType"])[below][order].tolist(),
+        candidate_users[order].tolist(),
+        candidate_pcts[order].tolist(),
+        _IMPACT_LEVELS[ranks[order]].tolist(),
+        reviews[order].tolist(),
+    ):
         recommendation_text: str
         if requires_review:
             recommendation_text = (
@@ -294,8 +330,10 @@ def recommend_component_removal(
                 f"high license requirement ({license_type})"
             )
 
+        # Every field is a plain str/int/float/bool computed above, so
+        # model_construct skips validation that cannot fail.
         removal_candidates.append(
-            ComponentRemovalCandidate(
+            ComponentRemovalCandidate.model_construct(
                 menu_item=aot_name,
                 license_type=license_type,
                 users_affected=users_who_used,
@@ -307,9 +345,6 @@ def recommend_component_removal(
             )
         )
 
-    # Step 6: Sort by impact (Low first, then Medium, then High)
-    removal_candidates.sort(key=lambda c: _IMPACT_ORDER.get(c.impact, 99))
-
     # Build expected outcome
     count: int = len(removal_candidates)
     if count > 0:
@@ -326,3 +361,131 @@ def recommend_component_removal(
         components_to_remove=removal_candidates,
         expected_outcome=expected_outcome,
     )
+
+
+def _partition_by_role(
+    security_config: pd.DataFrame,
+    user_roles: pd.DataFrame,
+    user_activity: pd.DataFrame,
+    role_names: list[str],
+) -> Iterator[tuple[str, pd.DataFrame, pd.DataFrame, pd.DataFrame]]:
+    """Yield each role's own config, user-role and activity rows.
+
+    Each input is grouped once (security_config and user_roles by role,
+    user_activity by user), so yielding a role costs only its own rows.
+    Frames indexed with build_role_index are accepted.
+
+    Args:
+        security_config: Full security configuration.
+        user_roles: Full user-role assignments.
+        user_activity: Full activity log.
+        role_names: Roles to yield, in order.
+
+    Yields:
+        Tuples of (role_name, role_config, role_users, role_activity).
+    """
+    # Grouping on the column values rather than the column label keeps
+    # frames indexed by build_role_index (where the label is both an index
+    # level and a column) unambiguous.
+    config_rows: dict[Any, np.ndarray] = security_config.groupby(
+        security_config["securityrole"].to_numpy(), sort=False
+    ).indices
+    role_user_rows: dict[Any, np.ndarray] = user_roles.groupby(
+        user_roles["role_name"].to_numpy(), sort=False
+    ).indices
+    activity_rows: dict[Any, np.ndarray] = user_activity.groupby(
+        user_activity["user_id"].to_numpy(), sort=False
+    ).indices
+    no_rows: np.ndarray = np.array([], dtype=np.intp)
+
+    for name in role_names:
+        role_users: pd.DataFrame = user_roles.iloc[role_user_rows.get(name, no_rows)]
+        user_positions: list[np.ndarray] = [
+            activity_rows[uid] for uid in role_users["user_id"].unique() if uid in activity_rows
+        ]
+        role_activity: pd.DataFrame = user_activity.iloc[
+            np.sort(np.concatenate(user_positions)) if user_positions else no_rows
+        ]
+        yield (
+            name,
+            security_config.iloc[config_rows.get(name, no_rows)],
+            role_users,
+            role_activity,
+        )
+
+
+def recommend_component_removal_batch(
+    security_config: pd.DataFrame,
+    user_roles: pd.DataFrame,
+    user_activity: pd.DataFrame,
+    pricing_config: dict[str, Any],
+    role_names: list[str] | None = None,
+    usage_threshold: float = 5.0,
+    max_workers: int | None = None,
+) -> list[ComponentRemovalResult]:
+    """Recommend component removals for multiple roles in batch.
+
+    When role_names is None, discovers and analyzes ALL unique roles present
+    in the security configuration data.
+
+    Produces the same results as calling recommend_component_removal() per
+    role, but partitions each input once -- security_config by role,
+    user_roles by role, user_activity by user -- and hands every role only
+    its own rows, so the cost is linear in rows plus roles instead of
+    rows times roles.
+
+    Roles are independent, so with ``max_workers`` > 1 they are analyzed
+    in a process pool.  Each worker receives only its roles' rows, not the
+    full frames.  Starting the pool costs far more than one role, so this
+    only pays off for many roles or large ones.
+
+    Args:
+        security_config: DataFrame with columns ``securityrole``, ``AOTName``,
+            ``LicenseType``, etc.
+        user_roles: DataFrame with columns ``user_id``, ``role_name``.
+        user_activity: DataFrame with columns ``user_id``, ``menu_item``, etc.
+        pricing_config: Parsed pricing.json dictionary.
+        role_names: Roles to analyze. If None, all unique roles in
+            security_config are discovered and analyzed.
+        usage_threshold: Maximum usage percentage below which an item is
+            considered a removal candidate. Default 5.0 (5%).
+        max_workers: Number of worker processes. None or 1 (default)
+            analyzes the roles in the calling process.
+
+    Returns:
+        List of ComponentRemovalResult, one per role, in role_names order.
+    """
+    if role_names is None:
+        role_names = sorted(security_config["securityrole"].dropna().unique().tolist())
+
+    partitions = _partition_by_role(security_config, user_roles, user_activity, role_names)
+
+    if max_workers is None or max_workers <= 1:
+        return [
+            recommend_component_removal(
+                role_name=name,
+                security_config=role_config,
+                user_roles=role_users,
+                user_activity=role_activity,
+                pricing_config=pricing_config,
+                usage_threshold=usage_threshold,
+            )
+            for name, role_config, role_users, role_activity in partitions
+        ]
+
+    if not role_names:
+        return []
+    names, configs, users, activities = zip(*partitions, strict=True)
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        return list(
+            pool.map(
+                recommend_component_removal,
+                names,
+                configs,
+                users,
+                activities,
+                repeat(pricing_config),
+                repeat(usage_threshold),
+                chunksize=max(1, len(names) // (max_workers * 4)),
+            )
+        )
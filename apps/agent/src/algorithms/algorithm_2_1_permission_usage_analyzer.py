@@ -22,10 +22,12 @@ Key design decisions:
 
 from __future__ import annotations
 
+import functools
 import uuid
 from datetime import UTC, datetime
 from typing import Any
 
+import numpy as np
 import pandas as pd
 
 from ..models.output_schemas import (
@@ -35,8 +37,12 @@ from ..models.output_schemas import (
     RecommendationReason,
     SavingsEstimate,
 )
+from ..utils.frames import str_values
 from ..utils.pricing import get_license_price
 
+__all__ = ["analyze_permission_usage"]
+
+
 # License tier priority: higher value = more expensive license.
 # Used to determine the "theoretical license" (highest tier across assigned
 # roles) and the "actual needed license" (highest tier actually used).
@@ -50,39 +56,176 @@ _LICENSE_TIER_PRIORITY: dict[str, int] = {
     "Commerce": 5,
 }
 
+# Actual license of a user whose activity records no license tier.
+_DEFAULT_ACTUAL_LICENSE: tuple[str, int] = ("Team Members", _LICENSE_TIER_PRIORITY["Team Members"])
+
 # Threshold: users using fewer than this fraction of their theoretical
 # permissions are flagged for permission reduction review.
 _PERMISSION_UTILIZATION_THRESHOLD: float = 0.50
 
 
-def _get_tier_priority(tier: str) -> int:
-    """Return the priority for a license tier string.
+def _highest_tier_per_user(user_ids: pd.Series, tiers: pd.Series) -> dict[Any, tuple[str, int]]:
+    """Return each user's highest-priority license tier and its priority.
+
+    Tiers are mapped to int8 priorities in one vectorized pass (unknown
+    tiers rank 0), so callers compare plain ints instead of looking tier
+    names up again.  Equally ranked tiers (e.g., Finance and SCM) are
+    resolved to the one seen first, so the result does not depend on set
+    iteration order.
+
+    Args:
+        user_ids: User of each row.
+        tiers: License tier of each row, aligned with ``user_ids``.
+
+    Returns:
+        Mapping of user ID to (tier, priority).  Users with no rows are
+        absent; callers treat them as "Team Members".
+    """
+    ranked = pd.DataFrame(
+        {
+            "user_id": user_ids.to_numpy(),
+            "tier": tiers.to_numpy(),
+            "priority": tiers.map(_LICENSE_TIER_PRIORITY).fillna(0).to_numpy(dtype=np.int8),
+        }
+    )
+    ranked = ranked.sort_values("priority", ascending=False, kind="stable")
+    ranked = ranked.drop_duplicates("user_id")
+    return dict(
+        zip(
+            ranked["user_id"].tolist(),
+            zip(ranked["tier"].tolist(), ranked["priority"].tolist(), strict=True),
+            strict=True,
+        )
+    )
+
+
+def _license_price_map(pricing_config: dict[str, Any], tiers: set[str]) -> dict[str, float]:
+    """Resolve the monthly price of each license tier once.
+
+    Args:
+        pricing_config: Parsed pricing.json dictionary.
+        tiers: License tier names to price.
+
+    Returns:
+        Mapping of tier to monthly price.  Tiers that cannot be resolved
+        by get_license_price() are omitted.
+    """
+    prices: dict[str, float] = {}
+    for tier in tiers:
+        try:
+            prices[tier] = get_license_price(pricing_config, tier)
+        except KeyError:
+            continue
+    return prices
+
+
+def _join_role_permissions(assignments: pd.DataFrame, permissions: pd.DataFrame) -> pd.DataFrame:
+    """Join user-role assignments to role permissions on the role.
 
-    Falls back to 0 for unknown tiers so the algorithm degrades
-    gracefully when encountering unexpected data.
+    Roles are factorized into one shared integer vocabulary so the hash
+    join runs on int codes, and the repeated user, menu item and tier
+    strings are carried as ``category`` columns, so the joined frame (one
+    row per reachable user/menu item pair) holds small integer codes
+    rather than an object pointer per cell.
 
     Args:
-        tier: License tier name (e.g., "Finance", "Team Members").
+        assignments: Frame with str columns ``user_key`` and ``role``.
+        permissions: Frame with str columns ``role``, ``menu_item`` and
+            ``tier``.
 
     Returns:
-        Integer priority.  Higher means more expensive.
+        Frame with ``user_key``, ``menu_item`` and ``tier`` columns, rows
+        in the order ``assignments.merge(permissions, on="role")`` gives.
     """
-    return _LICENSE_TIER_PRIORITY.get(tier, 0)
+    n_permissions: int = len(permissions)
+    role_codes, _ = pd.factorize(
+        np.concatenate([permissions["role"].to_numpy(), assignments["role"].to_numpy()])
+    )
+    left = pd.DataFrame(
+        {
+            "user_key": pd.Categorical(assignments["user_key"].to_numpy()),
+            "role_code": role_codes[n_permissions:],
+        }
+    )
+    right = pd.DataFrame(
+        {
+            "role_code": role_codes[:n_permissions],
+            "menu_item": pd.Categorical(permissions["menu_item"].to_numpy()),
+            "tier": pd.Categorical(permissions["tier"].to_numpy()),
+        }
+    )
+    return left.merge(right, on="role_code").drop(columns="role_code")
+
 
+def _count_menu_items(
+    theoretical: pd.DataFrame,
+    user_activity: pd.DataFrame,
+) -> tuple[pd.Series, pd.Series]:
+    """Count each user's theoretical menu items and how many of them were used.
 
-def _highest_tier(tiers: set[str]) -> str:
-    """Return the license tier with the highest priority from a set.
+    Users and menu items are factorized into shared integer vocabularies
+    and each (user, menu item) pair is packed into one int64 code, so the
+    deduplication and the theoretical/actual intersection are hash passes
+    over plain integers (``pd.unique`` / ``isin``) instead of over Python
+    tuples.
 
     Args:
-        tiers: Set of license tier names.
+        theoretical: Joined assignments and permissions with str (or
+            categorical of str) columns ``user_key`` and ``menu_item``.
+        user_activity: Activity with raw ``user_id`` and ``menu_item``.
+            Activity users match theoretical users by ``str(user_id)``;
+            menu items must be equal as values.
 
     Returns:
-        The tier name with the highest priority.  Returns "Team Members"
-        if the set is empty.
+        Tuple of (theoretical_counts, used_counts).  theoretical_counts is
+        indexed by str user key, used_counts by raw activity user ID;
+        users without items count 0 or are absent.
     """
-    if not tiers:
-        return "Team Members"
-    return max(tiers, key=_get_tier_priority)
+    activity = user_activity[user_activity["menu_item"].notna()]
+    act_user_codes, act_users = pd.factorize(activity["user_id"])
+
+    # Activity users map to theoretical users through their str key.
+    user_codes, user_keys = pd.factorize(theoretical["user_key"])
+    act_key_codes: np.ndarray = user_keys.get_indexer(act_users.map(str))
+
+    n_theoretical: int = len(theoretical)
+    item_codes, item_vocab = pd.factorize(
+        np.concatenate(
+            [
+                theoretical["menu_item"].to_numpy(dtype=object),
+                activity["menu_item"].to_numpy(dtype=object),
+            ]
+        )
+    )
+    n_items: int = max(len(item_vocab), 1)
+
+    theoretical_pairs: np.ndarray = pd.unique(
+        user_codes.astype(np.int64) * n_items + item_codes[:n_theoretical]
+    )
+    theoretical_counts = pd.Series(
+        np.bincount(theoretical_pairs // n_items, minlength=len(user_keys)),
+        index=user_keys,
+    )
+
+    # Distinct (activity user, item) pairs; NaN users are dropped, as the
+    # per-user groupby drops them.
+    act_pairs: np.ndarray = pd.unique(
+        (act_user_codes.astype(np.int64) * n_items + item_codes[n_theoretical:])[
+            act_user_codes >= 0
+        ]
+    )
+    act_pair_users: np.ndarray = act_pairs // n_items
+    act_pair_keys: np.ndarray = act_key_codes[act_pair_users]
+    used: np.ndarray = (act_pair_keys >= 0) & (
+        pd.Series(act_pair_keys.astype(np.int64) * n_items + act_pairs % n_items)
+        .isin(theoretical_pairs)
+        .to_numpy()
+    )
+    used_counts = pd.Series(
+        np.bincount(act_pair_users[used], minlength=len(act_users)),
+        index=act_users,
+    )
+    return theoretical_counts, used_counts
 
 
 def _determine_confidence_level(score: float) -> ConfidenceLevel:
@@ -121,6 +264,37 @@ def _compute_tags(
     Returns:
         List of string tags for filtering and categorization.
     """
+    if annual_savings >= 1000.0:
+        savings_bucket = 2
+    elif annual_savings > 0.0:
+        savings_bucket = 1
+    else:
+        savings_bucket = 0
+    low_utilization = permission_utilization is not None and permission_utilization < 50.0
+    return list(_tags_for(action, savings_bucket, confidence_level, low_utilization))
+
+
+@functools.lru_cache(maxsize=128)
+def _tags_for(
+    action: RecommendationAction,
+    savings_bucket: int,
+    confidence_level: ConfidenceLevel,
+    low_utilization: bool,
+) -> tuple[str, ...]:
+    """Build the tag tuple for one bucketed combination of inputs.
+
+    There are only a few dozen combinations, so each is built once and
+    reused; callers copy the tuple into a fresh list per recommendation.
+
+    Args:
+        action: The recommended action.
+        savings_bucket: 2 for high savings, 1 for moderate, 0 for none.
+        confidence_level: Confidence level of the recommendation.
+        low_utilization: Whether permission utilization is below 50%.
+
+    Returns:
+        Tuple of string tags for filtering and categorization.
+    """
     tags: list[str] = []
 
     if action == RecommendationAction.DOWNGRADE:
@@ -130,9 +304,9 @@ def _compute_tags(
     elif action == RecommendationAction.REVIEW_REQUIRED:
         tags.append("permission_reduction")
 
-    if annual_savings >= 1000.0:
+    if savings_bucket == 2:
         tags.append("high_savings")
-    elif annual_savings > 0.0:
+    elif savings_bucket == 1:
         tags.append("moderate_savings")
 
     if confidence_level == ConfidenceLevel.HIGH:
@@ -140,10 +314,10 @@ def _compute_tags(
     elif confidence_level == ConfidenceLevel.LOW:
         tags.append("low_confidence")
 
-    if permission_utilization is not None and permission_utilization < 50.0:
+    if low_utilization:
         tags.append("low_utilization")
 
-    return tags
+    return tuple(tags)
 
 
 def analyze_permission_usage(
@@ -153,6 +327,7 @@ def analyze_permission_usage(
     pricing_config: dict[str, Any],
     min_activity_days: int = 0,
     analysis_period_days: int = 90,
+    build_narrative: bool = True,
 ) -> list[LicenseRecommendation]:
     """Analyze permission vs. usage for all users and generate recommendations.
 
@@ -184,11 +359,24 @@ def analyze_permission_usage(
         min_activity_days: Minimum days of activity history required.
             Users with fewer days are skipped.  Default 30.
         analysis_period_days: Reported analysis period.  Default 90.
+        build_narrative: If False, skip the human-readable reason text
+            (and the unused-role scan behind it); each recommendation's
+            reason then has an empty primary_factor and no factors.
+            Actions, savings and confidence are unaffected.  Default True.
 
     Returns:
         List of LicenseRecommendation objects sorted by annual savings
         descending (highest savings first).
+
+    Raises:
+        ValueError: If ``analysis_period_days`` is outside 1-3650, the
+            range LicenseRecommendation accepts.
     """
+    # The output models are built without validation, so the one
+    # caller-supplied field with a constraint is checked here.
+    if not 1 <= analysis_period_days <= 3650:
+        raise ValueError(f"analysis_period_days must be 1-3650, got {analysis_period_days}")
+
     recommendations: list[LicenseRecommendation] = []
 
     # --- Guard: empty activity data ---
@@ -199,74 +387,136 @@ def analyze_permission_usage(
     if user_role_assignments.empty:
         return recommendations
 
-    # --- Pre-compute: role -> set of (menu_item, license_tier) ---
-    # Vectorized build of the lookup table from security_config.
-    role_permissions: dict[str, list[tuple[str, str]]] = {}
-    if not security_config.empty:
-        for row in security_config.itertuples(index=False):
-            role = str(row.securityrole)
-            menu_item = str(row.AOTName)
-            license_tier = str(row.LicenseType)
-            role_permissions.setdefault(role, []).append((menu_item, license_tier))
+    # --- Guard: no role permissions (no user has theoretical items) ---
+    if security_config.empty:
+        return recommendations
+
+    # --- Stringify the keys once ---
+    # Roles, menu items, tiers and assigned user IDs are compared as str.
+    permissions = pd.DataFrame(
+        {
+            "role": str_values(security_config["securityrole"], missing_as_nan=False),
+            "menu_item": str_values(security_config["AOTName"], missing_as_nan=False),
+            "tier": str_values(security_config["LicenseType"], missing_as_nan=False),
+        }
+    )
+    assignments = pd.DataFrame(
+        {
+            "user_key": str_values(user_role_assignments["user_id"], missing_as_nan=False),
+            "role": str_values(user_role_assignments["role_name"], missing_as_nan=False),
+        }
+    )
+
+    # --- Pre-compute: role -> frozenset of menu items ---
+    # Built once per role for unused-role detection, rather than per user.
+    # groupby().indices splits the rows per key in one pass, without
+    # boxing each row into a named tuple.
+    perm_items: np.ndarray = permissions["menu_item"].to_numpy()
+    role_items: dict[str, frozenset[str]] = {
+        role: frozenset(perm_items[rows].tolist())
+        for role, rows in permissions.groupby("role").indices.items()
+    }
 
     # --- Pre-compute: user -> set of assigned roles ---
-    user_roles_map: dict[str, set[str]] = {}
-    for row in user_role_assignments.itertuples(index=False):
-        uid = str(row.user_id)
-        role = str(row.role_name)
-        user_roles_map.setdefault(uid, set()).add(role)
+    assigned_role_names: np.ndarray = assignments["role"].to_numpy()
+    user_roles_map: dict[str, set[str]] = {
+        uid: set(assigned_role_names[rows].tolist())
+        for uid, rows in assignments.groupby("user_key").indices.items()
+    }
+
+    # --- Pre-compute per-user theoretical and actual profiles ---
+    # One join of assignments to role permissions gives every (user, menu
+    # item, tier) a user can reach; grouping it replaces rebuilding Python
+    # sets per user.
+    # A role may list the same menu item under several tiers; only the
+    # highest tier of each (role, menu item) can drive a user's license,
+    # so the rest are dropped before they are multiplied by the join.
+    # Kept rows stay in their original order, so ties still go to the
+    # tier seen first.
+    permission_priority: np.ndarray = (
+        permissions["tier"].map(_LICENSE_TIER_PRIORITY).fillna(0).to_numpy(dtype=np.int8)
+    )
+    unique_permissions = (
+        permissions.iloc[np.argsort(-permission_priority, kind="stable")]
+        .drop_duplicates(["role", "menu_item"])
+        .sort_index()
+    )
+    theoretical = _join_role_permissions(assignments, unique_permissions)
+    theoretical_counts, used_counts = _count_menu_items(theoretical, user_activity)
+    theoretical_licenses = _highest_tier_per_user(theoretical["user_key"], theoretical["tier"])
+
+    # Actual profiles are keyed by the raw user_id the activity is grouped by.
+    tiered_activity = user_activity[user_activity["license_tier"].notna()]
+    actual_licenses = _highest_tier_per_user(
+        tiered_activity["user_id"], tiered_activity["license_tier"]
+    )
+
+    # --- Check minimum activity days ---
+    # Timestamps are parsed in one pass and spanned per user; users with
+    # too short a history are dropped before the per-user loop.  A user
+    # whose timestamps are all missing has a NaN span and is kept.
+    timestamps = pd.to_datetime(user_activity["timestamp"])
+    spans = timestamps.groupby(user_activity["user_id"], sort=False).agg(["min", "max"])
+    span_days: pd.Series = (spans["max"] - spans["min"]).dt.days
+
+    # --- Keep only users who can be analyzed ---
+    # Users without theoretical items (no roles, or roles without menu
+    # items) are dropped with the short-history users, so the loop below
+    # only visits eligible users.
+    has_theoretical: np.ndarray = (
+        theoretical_counts.reindex(span_days.index.map(str), fill_value=0).to_numpy() > 0
+    )
+    eligible_users = span_days.index[has_theoretical & ~(span_days < min_activity_days).to_numpy()]
+
+    # Each user's activity rows as positions into the column arrays; the
+    # loop slices arrays instead of building a sub-DataFrame per user.
+    user_rows: dict[Any, np.ndarray] = user_activity.groupby("user_id", sort=False).indices
+    activity_menu_items: np.ndarray = user_activity["menu_item"].to_numpy(dtype=object)
+
+    # Every current or recommended license is some user's highest tier,
+    # or the default actual license.
+    license_prices = _license_price_map(
+        pricing_config,
+        {tier for tier, _ in theoretical_licenses.values()}
+        | {tier for tier, _ in actual_licenses.values() if isinstance(tier, str)}
+        | {_DEFAULT_ACTUAL_LICENSE[0]},
+    )
+
+    # Annual savings of each recommendation, collected for the final sort.
+    sort_savings: list[float] = []
+
+    # All recommendations of one run share its timestamp.
+    generated_at = datetime.now(UTC)
 
     # --- Process each user with activity data ---
-    for raw_user_id, user_group in user_activity.groupby("user_id", sort=False):
+    for raw_user_id in eligible_users:
+        rows = user_rows[raw_user_id]
         user_id = str(raw_user_id)
 
-        # Skip users without role assignments
-        if user_id not in user_roles_map:
-            continue
-
-        # --- Check minimum activity days ---
-        timestamps = pd.to_datetime(user_group["timestamp"])
-        if timestamps.empty:
-            continue
-        activity_span_days = (timestamps.max() - timestamps.min()).days
-        if activity_span_days < min_activity_days:
-            continue
+        span = span_days[raw_user_id]
+        activity_span_days = int(span) if pd.notna(span) else span
 
         # --- Theoretical permissions from assigned roles ---
         assigned_roles = user_roles_map[user_id]
-        theoretical_items: set[str] = set()
-        theoretical_tiers: set[str] = set()
-        for role in assigned_roles:
-            for menu_item, license_tier in role_permissions.get(role, []):
-                theoretical_items.add(menu_item)
-                theoretical_tiers.add(license_tier)
-
-        if not theoretical_items:
-            continue
-
-        theoretical_license = _highest_tier(theoretical_tiers)
+        total_theoretical = int(theoretical_counts[user_id])
+        theoretical_license, theoretical_priority = theoretical_licenses[user_id]
 
         # --- Actual usage from activity data ---
-        actual_items_used: set[str] = set(user_group["menu_item"].dropna().unique().tolist())
-        actual_tiers_used: set[str] = set(user_group["license_tier"].dropna().unique().tolist())
-        actual_needed_license = _highest_tier(actual_tiers_used)
+        actual_needed_license, actual_priority = actual_licenses.get(
+            raw_user_id, _DEFAULT_ACTUAL_LICENSE
+        )
 
         # --- Permission utilization ---
-        total_theoretical = len(theoretical_items)
-        used_count = len(actual_items_used & theoretical_items)
+        used_count = int(used_counts.get(raw_user_id, 0))
         permission_utilization = (
             (used_count / total_theoretical) * 100.0 if total_theoretical > 0 else 100.0
         )
 
         # --- Determine action ---
-        theoretical_priority = _get_tier_priority(theoretical_license)
-        actual_priority = _get_tier_priority(actual_needed_license)
-
-        try:
-            current_cost = get_license_price(pricing_config, theoretical_license)
-            recommended_cost: float
-        except KeyError:
+        current_cost = license_prices.get(theoretical_license)
+        if current_cost is None:
             continue
+        recommended_cost: float
 
         action: RecommendationAction
         recommended_license: str
@@ -276,10 +526,7 @@ def analyze_permission_usage(
             # Opportunity: user's activity requires a cheaper license
             action = RecommendationAction.DOWNGRADE
             recommended_license = actual_needed_license
-            try:
-                recommended_cost = get_license_price(pricing_config, recommended_license)
-            except KeyError:
-                recommended_cost = current_cost
+            recommended_cost = license_prices.get(recommended_license, current_cost)
             monthly_savings = max(current_cost - recommended_cost, 0.0)
         elif permission_utilization < _PERMISSION_UTILIZATION_THRESHOLD * 100.0:
             # Over-provisioned: too many unused permissions
@@ -298,7 +545,7 @@ def analyze_permission_usage(
 
         # --- Confidence scoring ---
         # Base confidence from permission utilization and activity volume
-        sample_size = len(user_group)
+        sample_size = len(rows)
         if action == RecommendationAction.DOWNGRADE:
             # High confidence when utilization is very low relative to tier
             if permission_utilization < 30.0:
@@ -326,7 +573,9 @@ def analyze_permission_usage(
         supporting_factors: list[str] = []
         risk_factors: list[str] = []
 
-        if action == RecommendationAction.DOWNGRADE:
+        if not build_narrative:
+            primary_factor = ""
+        elif action == RecommendationAction.DOWNGRADE:
             primary_factor = (
                 f"Actual usage requires {actual_needed_license} license, "
                 f"but user holds {theoretical_license} license"
@@ -349,11 +598,15 @@ def analyze_permission_usage(
                 f"({used_count} of {total_theoretical} menu items used)"
             )
             # Identify unused roles
-            unused_roles = []
-            for role in assigned_roles:
-                role_items = {mi for mi, _ in role_permissions.get(role, [])}
-                if role_items and not (role_items & actual_items_used):
-                    unused_roles.append(role)
+            # Deduplicate first so the NaN filter and set build touch
+            # each distinct item once, not every activity row.
+            user_items = pd.unique(activity_menu_items[rows])
+            actual_items_used = set(user_items[pd.notna(user_items)].tolist())
+            unused_roles = [
+                role
+                for role in assigned_roles
+                if role in role_items and role_items[role].isdisjoint(actual_items_used)
+            ]
             if unused_roles:
                 supporting_factors.append(f"Unused roles: {', '.join(sorted(unused_roles))}")
             supporting_factors.append(
@@ -369,7 +622,11 @@ def analyze_permission_usage(
             )
             supporting_factors.append(f"{used_count} of {total_theoretical} menu items used")
 
-        reason = RecommendationReason(
+        # Every field below is computed by this function with its declared
+        # type and within its constraints (confidence level from
+        # _determine_confidence_level, annual = monthly * 12), so
+        # model_construct skips validation that cannot fail.
+        reason = RecommendationReason.model_construct(
             primary_factor=primary_factor,
             supporting_factors=supporting_factors,
             risk_factors=risk_factors,
@@ -379,7 +636,7 @@ def analyze_permission_usage(
         # --- Savings estimate ---
         savings: SavingsEstimate | None = None
         if action == RecommendationAction.DOWNGRADE and monthly_savings > 0:
-            savings = SavingsEstimate(
+            savings = SavingsEstimate.model_construct(
                 monthly_current_cost=current_cost,
                 monthly_recommended_cost=recommended_cost,
                 monthly_savings=monthly_savings,
@@ -393,10 +650,10 @@ def analyze_permission_usage(
         )
 
         # --- Build recommendation ---
-        rec = LicenseRecommendation(
+        rec = LicenseRecommendation.model_construct(
             algorithm_id="2.1",
             recommendation_id=str(uuid.uuid4()),
-            generated_at=datetime.now(UTC),
+            generated_at=generated_at,
             user_id=user_id,
             current_license=theoretical_license,
             current_license_cost_monthly=current_cost,
@@ -417,11 +674,9 @@ def analyze_permission_usage(
         )
 
         recommendations.append(rec)
+        sort_savings.append(savings.annual_savings if savings else 0.0)
 
     # --- Sort by savings descending ---
-    recommendations.sort(
-        key=lambda r: r.savings.annual_savings if r.savings else 0.0,
-        reverse=True,
-    )
-
-    return recommendations
+    # Stable, so users with equal savings keep their activity order.
+    order = np.argsort(-np.asarray(sort_savings, dtype=np.float64), kind="stable")
+    return [recommendations[i] for i in order.tolist()]
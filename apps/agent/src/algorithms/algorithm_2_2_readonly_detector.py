@@ -17,10 +17,12 @@ Confidence scoring accounts for:
 
 from __future__ import annotations
 
+import functools
 from datetime import UTC, datetime
 from typing import Any
 import uuid
 
+import numpy as np
 import pandas as pd
 
 from ..models.output_schemas import (
@@ -32,6 +34,9 @@ from ..models.output_schemas import (
 )
 from ..utils.pricing import get_license_price
 
+__all__ = ["detect_readonly_users"]
+
+
 # Forms whose write operations are considered self-service and acceptable
 # under the Team Members license tier.
 SELF_SERVICE_FORMS: frozenset[str] = frozenset(
@@ -58,44 +63,66 @@ _DEFAULT_LICENSE_PRIORITY: dict[str, int] = {
 _WRITE_ACTIONS: frozenset[str] = frozenset({"Write", "Update", "Create", "Delete"})
 
 
-def _determine_current_license(
-    user_activity: pd.DataFrame,
-    pricing_config: dict[str, Any],
-) -> str:
-    """Determine a user's current license from the highest-tier activity.
+def _license_priority_map(pricing_config: dict[str, Any]) -> dict[str, int]:
+    """Build the license tier priority lookup from the pricing config.
 
-    The user's current license is the most expensive license tier observed
-    across all their activity records.  This reflects the license they must
-    hold to access those features.
+    Each configured license takes its ``priority`` entry, falling back to
+    the default priority of the same name.  Tiers missing from the config
+    are not in the map and rank 0.
 
     Args:
-        user_activity: Activity rows for a single user.
         pricing_config: Parsed pricing.json dictionary.
 
     Returns:
-        License type string (e.g., "Commerce", "SCM").
+        Mapping of license name to priority (higher = more expensive).
     """
     licenses_config: dict[str, Any] = pricing_config.get("licenses", {})
-    priority_map: dict[str, int] = {}
-    for name, info in licenses_config.items():
-        priority_map[name] = int(info.get("priority", _DEFAULT_LICENSE_PRIORITY.get(name, 0)))
+    return {
+        name: int(info.get("priority", _DEFAULT_LICENSE_PRIORITY.get(name, 0)))
+        for name, info in licenses_config.items()
+    }
 
-    unique_tiers: list[str] = user_activity["license_tier"].unique().tolist()
-    best_license: str = unique_tiers[0]
-    best_priority: int = priority_map.get(best_license, 0)
 
-    for tier in unique_tiers[1:]:
-        tier_priority: int = priority_map.get(tier, 0)
-        if tier_priority > best_priority:
-            best_license = tier
-            best_priority = tier_priority
+def _current_license_per_user(
+    license_tiers: pd.Series,
+    starts: np.ndarray,
+    pricing_config: dict[str, Any],
+) -> np.ndarray:
+    """Determine each user's current license from the highest-tier activity.
 
-    return best_license
+    A user's current license is the most expensive license tier observed
+    across all their activity records.  This reflects the license they must
+    hold to access those features.  Tiers are mapped to priorities in one
+    pass and the first row holding each user's top priority is picked, so
+    equally ranked tiers resolve to the one seen first.
+
+    Args:
+        license_tiers: License tier of each activity row, with each user's
+            rows contiguous and in activity order.
+        starts: Position of each user's first row in ``license_tiers``.
+        pricing_config: Parsed pricing.json dictionary.
+
+    Returns:
+        License type string (e.g., "Commerce", "SCM") of each user, in the
+        order of ``starts``.
+    """
+    priorities: np.ndarray = (
+        license_tiers.map(_license_priority_map(pricing_config)).fillna(0).to_numpy(dtype=np.int32)
+    )
+    segment_ids: np.ndarray = np.repeat(
+        np.arange(len(starts)), np.diff(np.append(starts, len(priorities)))
+    )
+    # Sorting by (user, descending priority) keeps every user's rows in
+    # place, so each user's top row lands on its start; lexsort is stable,
+    # so among equal priorities the earliest row comes first.
+    order: np.ndarray = np.lexsort((-priorities, segment_ids))
+    current_licenses: np.ndarray = license_tiers.to_numpy(dtype=object)[order[starts]]
+    return current_licenses
 
 
 def _assess_confidence(
     write_count: int,
-    write_menu_items: pd.Series,  # type: ignore[type-arg]
+    all_self_service: bool,
 ) -> tuple[float, ConfidenceLevel]:
     """Assess confidence for a read-only classification.
 
@@ -112,7 +139,7 @@ def _assess_confidence(
 
     Args:
         write_count: Total number of write operations.
-        write_menu_items: Series of menu_item values for write operations.
+        all_self_service: Whether every write targets a self-service form.
 
     Returns:
         Tuple of (confidence_score, confidence_level).
@@ -128,11 +155,8 @@ def _assess_confidence(
         base_score = 0.55
 
     # Self-service boost: all writes to eligible forms
-    if write_count > 0:
-        unique_write_forms: set[str] = set(write_menu_items.unique())
-        all_self_service: bool = unique_write_forms.issubset(SELF_SERVICE_FORMS)
-        if all_self_service:
-            base_score = min(base_score + 0.15, 1.0)
+    if write_count > 0 and all_self_service:
+        base_score = min(base_score + 0.15, 1.0)
 
     # Determine confidence level from final score
     if base_score >= 0.90:
@@ -193,7 +217,7 @@ def _build_recommendation_reason(
     if action == RecommendationAction.NO_CHANGE and current_license == "Team Members":
         supporting.append("User already on optimal Team Members license")
 
-    return RecommendationReason(
+    return RecommendationReason.model_construct(
         primary_factor=primary,
         supporting_factors=supporting,
         risk_factors=risk,
@@ -207,6 +231,7 @@ def detect_readonly_users(
     pricing_config: dict[str, Any],
     read_threshold: float = 0.95,
     min_sample_size: int = 100,
+    build_narrative: bool = True,
 ) -> list[LicenseRecommendation]:
     """Detect users whose activity is predominantly read-only.
 
@@ -219,7 +244,9 @@ def detect_readonly_users(
     Args:
         user_activity: DataFrame with columns ``user_id``, ``timestamp``,
             ``menu_item``, ``action``, ``session_id``, ``license_tier``,
-            ``feature``.
+            ``feature``.  ``user_id``, ``menu_item``, ``action`` and
+            ``license_tier`` may be ``category`` dtype (see
+            ``src.utils.frames.as_categorical``).
         security_config: DataFrame with security role to license mapping.
             Used for form eligibility validation.
         pricing_config: Parsed ``pricing.json`` dictionary with license
@@ -229,6 +256,10 @@ def detect_readonly_users(
         min_sample_size: Minimum number of operations required for a user
             to be considered.  Users with fewer operations are skipped.
             Default 100.
+        build_narrative: If False, skip the human-readable reason text;
+            each recommendation's reason then has an empty
+            primary_factor and no factors.  Actions, savings and
+            confidence are unaffected.  Default True.
 
     Returns:
         List of ``LicenseRecommendation`` objects, sorted by annual
@@ -238,48 +269,91 @@ def detect_readonly_users(
     recommendations: list[LicenseRecommendation] = []
     threshold_pct: float = read_threshold * 100.0
 
-    grouped = user_activity.groupby("user_id")
+    # --- Read/write counts for every user ---
+    # user_id is factorized once, in the sorted order groupby would give
+    # (missing IDs are dropped), and every per-user quantity below is a
+    # bincount or sort over those integer codes.  The read and write
+    # masks are plain bool arrays (a category ``action`` column compares
+    # on its codes).  A missing action in a nullable ``string`` column is
+    # neither: it still counts toward the user's writes, but has no write
+    # form.
+    user_codes, user_index = pd.factorize(user_activity["user_id"], sort=True)
+    is_read_eq: pd.Series = user_activity["action"] == "Read"
+    is_read_all: np.ndarray = is_read_eq.to_numpy(dtype=bool, na_value=False)
+    is_write_all: np.ndarray = (~is_read_eq).to_numpy(dtype=bool, na_value=False)
+    has_user: np.ndarray = user_codes >= 0
+    total_counts: np.ndarray = np.bincount(user_codes[has_user], minlength=len(user_index))
+    read_counts: np.ndarray = np.bincount(
+        user_codes[has_user & is_read_all], minlength=len(user_index)
+    )
 
-    for user_id, group_df in grouped:
+    # Users with too few operations or too many writes are dropped here,
+    # so the per-user work below only visits read-only candidates.
+    is_qualified: np.ndarray = (total_counts >= min_sample_size) & (
+        read_counts / total_counts * 100.0 >= threshold_pct
+    )
+    qualified_codes: np.ndarray = np.flatnonzero(is_qualified)
+
+    # Candidate rows grouped by user (activity order within each user),
+    # so each candidate's rows are one contiguous slice.  The appended
+    # False is what code -1 (missing user ID) looks up.
+    candidate_rows: np.ndarray = np.flatnonzero(np.append(is_qualified, False)[user_codes])
+    candidate_rows = candidate_rows[np.argsort(user_codes[candidate_rows], kind="stable")]
+    stops: np.ndarray = np.cumsum(total_counts[qualified_codes])
+    starts: np.ndarray = stops - total_counts[qualified_codes]
+    candidate_is_read: np.ndarray = is_read_all[candidate_rows]
+    candidate_is_write: np.ndarray = is_write_all[candidate_rows]
+    # Menu items become integer codes into a table of distinct forms
+    # (missing values get a code of their own), so a user's self-service
+    # check is a boolean lookup and deduplication works on small ints.
+    candidate_form_codes, form_table = pd.factorize(
+        user_activity["menu_item"].iloc[candidate_rows], use_na_sentinel=False
+    )
+    form_names: list[Any] = form_table.tolist()
+    is_self_service_form: np.ndarray = np.array(
+        [name in SELF_SERVICE_FORMS for name in form_names], dtype=bool
+    )
+    current_licenses: np.ndarray = _current_license_per_user(
+        user_activity["license_tier"].iloc[candidate_rows], starts, pricing_config
+    )
+    # Prices are resolved on first use and reused for later users, so
+    # each license is looked up once per run rather than once per user.
+    license_prices: dict[Any, float] = {}
+    # Annual savings of each recommendation, collected for the final sort.
+    sort_savings: list[float] = []
+    # All recommendations of one run share its timestamp.
+    generated_at: datetime = datetime.now(UTC)
+
+    for user_id, start, stop, current_license in zip(
+        user_index[qualified_codes], starts.tolist(), stops.tolist(), current_licenses, strict=True
+    ):
         user_id_str: str = str(user_id)
-        total_ops: int = len(group_df)
-
-        # Skip users with insufficient data
-        if total_ops < min_sample_size:
-            continue
+        total_ops: int = stop - start
 
         # Count read vs write operations
-        is_read: pd.Series = group_df["action"] == "Read"  # type: ignore[assignment]
-        read_ops: int = int(is_read.sum())
+        is_read: np.ndarray = candidate_is_read[start:stop]
+        read_ops: int = int(np.count_nonzero(is_read))
         write_ops: int = total_ops - read_ops
-
-        # Skip users with zero operations (defensive)
-        if total_ops == 0:
-            continue
-
         read_percentage: float = (read_ops / total_ops) * 100.0
 
-        # Check if user meets the read-only threshold
-        if read_percentage < threshold_pct:
-            continue
-
-        # Determine current license from highest-tier activity
-        current_license: str = _determine_current_license(group_df, pricing_config)
-        current_cost: float = get_license_price(pricing_config, current_license)
+        if current_license not in license_prices:
+            license_prices[current_license] = get_license_price(pricing_config, current_license)
+        current_cost: float = license_prices[current_license]
 
         # Assess confidence based on write operations
-        write_df: pd.DataFrame = group_df[~is_read]
-        write_menu_items: pd.Series = write_df["menu_item"]  # type: ignore[assignment]
+        write_form_codes: np.ndarray = candidate_form_codes[start:stop][
+            candidate_is_write[start:stop]
+        ]
+        all_self_service: bool = bool(is_self_service_form[write_form_codes].all())
+        unique_write_forms: list[str] = [
+            form_names[code] for code in dict.fromkeys(write_form_codes.tolist())
+        ]
 
         confidence_score, confidence_level = _assess_confidence(
             write_count=write_ops,
-            write_menu_items=write_menu_items,
+            all_self_service=all_self_service,
         )
 
-        # Check if all writes are self-service eligible
-        unique_write_forms: set[str] = set(write_menu_items.unique()) if write_ops > 0 else set()
-        all_self_service: bool = unique_write_forms.issubset(SELF_SERVICE_FORMS)
-
         # Determine recommended license
         recommended_license: str
         if current_license == "Team Members":
@@ -296,14 +370,18 @@ def detect_readonly_users(
             action = RecommendationAction.NO_CHANGE
 
         # Calculate savings
-        recommended_cost: float = get_license_price(pricing_config, recommended_license)
+        if recommended_license not in license_prices:
+            license_prices[recommended_license] = get_license_price(
+                pricing_config, recommended_license
+            )
+        recommended_cost: float = license_prices[recommended_license]
         monthly_savings: float = max(current_cost - recommended_cost, 0.0)
         annual_savings: float = monthly_savings * 12.0
         confidence_adjusted: float = annual_savings * confidence_score
 
         savings: SavingsEstimate | None = None
         if action == RecommendationAction.DOWNGRADE:
-            savings = SavingsEstimate(
+            savings = SavingsEstimate.model_construct(
                 monthly_current_cost=current_cost,
                 monthly_recommended_cost=recommended_cost,
                 monthly_savings=monthly_savings,
@@ -312,25 +390,38 @@ def detect_readonly_users(
             )
 
         # Build structured reason
-        reason: RecommendationReason = _build_recommendation_reason(
-            read_ops=read_ops,
-            write_ops=write_ops,
-            read_percentage=read_percentage,
-            write_menu_items=list(unique_write_forms),
-            all_self_service=all_self_service,
-            action=action,
-            current_license=current_license,
-        )
+        reason: RecommendationReason
+        if build_narrative:
+            reason = _build_recommendation_reason(
+                read_ops=read_ops,
+                write_ops=write_ops,
+                read_percentage=read_percentage,
+                write_menu_items=unique_write_forms,
+                all_self_service=all_self_service,
+                action=action,
+                current_license=current_license,
+            )
+        else:
+            reason = RecommendationReason.model_construct(
+                primary_factor="",
+                supporting_factors=[],
+                risk_factors=[],
+                data_quality_notes=[],
+            )
 
         # Determine automation safety
         safe_to_automate: bool = (
             action == RecommendationAction.DOWNGRADE and confidence_level == ConfidenceLevel.HIGH
         )
 
-        rec = LicenseRecommendation(
+        # Every field is computed here with its declared type and within
+        # its constraints (confidence level from _assess_confidence's
+        # score, annual = monthly * 12), so model_construct skips
+        # validation that cannot fail.
+        rec = LicenseRecommendation.model_construct(
             algorithm_id="2.2",
             recommendation_id=str(uuid.uuid4()),
-            generated_at=datetime.now(UTC),
+            generated_at=generated_at,
             user_id=user_id_str,
             current_license=current_license,
             current_license_cost_monthly=current_cost,
@@ -351,14 +442,12 @@ def detect_readonly_users(
         )
 
         recommendations.append(rec)
+        sort_savings.append(annual_savings if savings else 0.0)
 
-    # Sort by annual savings descending (highest savings first)
-    recommendations.sort(
-        key=lambda r: r.savings.annual_savings if r.savings else 0.0,
-        reverse=True,
-    )
-
-    return recommendations
+    # Sort by annual savings descending (highest savings first).  Stable,
+    # so users with equal savings stay in user ID order.
+    order = np.argsort(-np.asarray(sort_savings, dtype=np.float64), kind="stable")
+    return [recommendations[i] for i in order.tolist()]
 
 
 def _compute_tags(
@@ -376,6 +465,31 @@ def _compute_tags(
     Returns:
         List of string tags for filtering and categorization.
     """
+    if annual_savings >= 1000.0:
+        savings_bucket = 2
+    elif annual_savings > 0.0:
+        savings_bucket = 1
+    else:
+        savings_bucket = 0
+    return list(_tags_for(action, savings_bucket, confidence_level))
+
+
+@functools.lru_cache(maxsize=32)
+def _tags_for(
+    action: RecommendationAction,
+    savings_bucket: int,
+    confidence_level: ConfidenceLevel,
+) -> tuple[str, ...]:
+    """Build the tag tuple for one bucketed combination of inputs.
+
+    Args:
+        action: The recommended action.
+        savings_bucket: 2 for high savings, 1 for moderate, 0 for none.
+        confidence_level: Confidence level of the recommendation.
+
+    Returns:
+        Tuple of string tags for filtering and categorization.
+    """
     tags: list[str] = []
 
     if action == RecommendationAction.DOWNGRADE:
@@ -383,9 +497,9 @@ def _compute_tags(
     elif action == RecommendationAction.NO_CHANGE:
         tags.append("already_optimal")
 
-    if annual_savings >= 1000.0:
+    if savings_bucket == 2:
         tags.append("high_savings")
-    elif annual_savings > 0.0:
+    elif savings_bucket == 1:
         tags.append("moderate_savings")
 
     if confidence_level == ConfidenceLevel.HIGH:
@@ -393,4 +507,4 @@ def _compute_tags(
     elif confidence_level == ConfidenceLevel.LOW:
         tags.append("low_confidence")
 
-    return tags
+    return tuple(tags)
@@ -32,6 +32,9 @@ from ..models.output_schemas import (
 )
 from ..utils.pricing import get_license_price
 
+__all__ = ["detect_license_minority_users"]
+
+
 # Write-type actions per D365 FO telemetry schema
 _WRITE_ACTIONS: frozenset[str] = frozenset({"Write", "Update", "Create", "Delete"})
 
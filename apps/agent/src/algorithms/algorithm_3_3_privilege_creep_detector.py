@@ -29,6 +29,8 @@ from ..models.output_schemas import (
     SavingsEstimate,
 )
 
+__all__ = ["detect_privilege_creep"]
+
 
 def detect_privilege_creep(
     user_id: str,
@@ -13,6 +13,8 @@ Created: 2026-02-06
 
 from typing import Any, Dict, List, Set
 
+__all__ = ["detect_toxic_combinations", "detect_toxic_combinations_batch"]
+
 
 def detect_toxic_combinations(
     user_id: str,
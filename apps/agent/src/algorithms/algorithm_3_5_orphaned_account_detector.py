@@ -27,6 +27,9 @@ from typing import List, Optional
 
 from pydantic import BaseModel, Field
 
+__all__ = ["OrphanType", "OrphanedAccountResult", "UserDirectoryRecord", "detect_orphaned_accounts"]
+
+
 # ---------------------------------------------------------------------------
 # Enums
 # ---------------------------------------------------------------------------
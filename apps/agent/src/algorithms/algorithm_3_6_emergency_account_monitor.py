@@ -30,6 +30,13 @@ from typing import Any, List
 import pandas as pd
 from pydantic import BaseModel, Field
 
+__all__ = [
+    "EmergencyAccountAlert",
+    "EmergencyAccountAnalysis",
+    "EmergencyAccountConfig",
+    "monitor_emergency_accounts",
+]
+
 
 # ---------------------------------------------------------------------------
 # High-risk menu items (per specification)
@@ -33,6 +33,8 @@ from pydantic import BaseModel, Field
 
 from ..utils.pricing import get_license_price
 
+__all__ = ["AttachOptimization", "AttachOptimizationResult", "optimize_license_attach"]
+
 
 # ---------------------------------------------------------------------------
 # Attach pricing lookup
@@ -28,6 +28,12 @@ import pandas as pd
 
 from ..models.input_schemas import SecurityConfigRecord
 
+__all__ = [
+    "LicenseRecommendationOption",
+    "NewUserLicenseRecommender",
+    "suggest_license_for_new_user",
+]
+
 
 @dataclass
 class LicenseRecommendationOption:
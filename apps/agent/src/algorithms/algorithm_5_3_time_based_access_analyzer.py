@@ -25,6 +25,8 @@ from typing import Optional
 import pandas as pd
 from pydantic import BaseModel, Field
 
+__all__ = ["TimeBasedAccessAlert", "TimeBasedAccessAnalysis", "analyze_time_based_access"]
+
 
 class TimeBasedAccessAlert(BaseModel):
     """Individual security alert for anomalous time-based access.
@@ -0,0 +1,83 @@
+"""DataFrame preparation shared by the algorithm inputs.
+
+The algorithm inputs carry a few heavily repeated string columns (role
+names, license types, user IDs, menu items).  Stored as ``category``
+dtype, each value is an integer code into a small table of distinct
+strings: the frame shrinks, and ``==``, ``isin``, ``groupby`` and
+``value_counts`` on those columns compare codes instead of hashing
+Python strings.
+
+Converting is itself a full pass over the column, so it pays off when
+done once at load time and the frame is then reused across many
+algorithm calls (e.g. one call per role), not inside each call.
+
+Usage:
+    from src.utils.frames import as_categorical
+
+    security_config = as_categorical(security_config, ["securityrole", "LicenseType"])
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import is_string_dtype
+
+__all__ = ["as_categorical", "str_values"]
+
+
+def as_categorical(df: pd.DataFrame, columns: Iterable[str]) -> pd.DataFrame:
+    """Return a frame with the given columns stored as ``category`` dtype.
+
+    Columns that are absent or already categorical are left as they are;
+    if nothing needs converting, ``df`` itself is returned.
+
+    Args:
+        df: Input frame (not modified).
+        columns: Names of the repeated-string columns to convert.
+
+    Returns:
+        Frame with the present columns converted.
+    """
+    to_convert: list[str] = [
+        col
+        for col in columns
+        if col in df.columns and not isinstance(df[col].dtype, pd.CategoricalDtype)
+    ]
+    if not to_convert:
+        return df
+    return df.astype(dict.fromkeys(to_convert, "category"))
+
+
+def str_values(column: pd.Series, *, missing_as_nan: bool = True) -> np.ndarray:
+    """Return a column's values as an object array of Python strs.
+
+    A column that already holds only strings (``str``, ``category`` of
+    strings, or ``object`` with no missing or non-string values) is
+    returned without a per-value ``str()`` pass.  Otherwise every value is
+    converted.  By default missing values (None, NaN, NA) all become
+    ``"nan"``, as ``str()`` of a row read through ``iterrows`` would give;
+    with ``missing_as_nan=False`` each keeps its own ``str()`` form
+    (``"None"``, ``"nan"``, ``"<NA>"``), as ``str()`` of a value read
+    through ``itertuples`` would give.
+
+    Args:
+        column: Input column (not modified).
+        missing_as_nan: Whether to normalize every missing value to
+            ``"nan"``.  Default True.
+
+    Returns:
+        Object array of str, aligned with ``column``.
+    """
+    if not column.hasnans and is_string_dtype(column):
+        strs: np.ndarray = column.to_numpy(dtype=object)
+    else:
+        values: np.ndarray = (
+            column.to_numpy(dtype=object, na_value=np.nan)
+            if missing_as_nan
+            else column.to_numpy(dtype=object)
+        )
+        strs = pd.Series(values, dtype=object).map(str).to_numpy()
+    return strs
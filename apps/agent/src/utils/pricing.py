@@ -21,10 +21,12 @@ Usage:
 
 from __future__ import annotations
 
+import functools
 import re
 from typing import Any
 
 
+@functools.lru_cache(maxsize=256)
 def _normalize_key(name: str) -> str:
     """Normalize a license name to lowercase with single underscores.
 
@@ -84,20 +86,44 @@ def get_license_price(pricing_config: dict[str, Any], license_name: str) -> floa
     if cleaned_name in licenses:
         return float(licenses[cleaned_name]["pricePerUserPerMonth"])
 
+    # Tiers 2 and 3 depend only on the key set, so their result is cached;
+    # the price itself is always read from the live config.
+    config_key: str | None = _match_config_key(tuple(licenses), cleaned_name)
+    if config_key is not None:
+        return float(licenses[config_key]["pricePerUserPerMonth"])
+
+    # No match found across all three tiers
+    raise KeyError(
+        f"License '{license_name}' not found in pricing config. "
+        f"Available: {list(licenses.keys())}"
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def _match_config_key(config_keys: tuple[str, ...], cleaned_name: str) -> str | None:
+    """Resolve a license name to a config key via the fallback tiers 2 and 3.
+
+    Memoized on the config's key tuple and the name: repeated lookups
+    across roles and users skip the per-key normalization scan, while a
+    config with a different key set is resolved afresh.
+
+    Args:
+        config_keys: Keys of ``pricing_config["licenses"]``, in order.
+        cleaned_name: Stripped license name with no exact (tier 1) match.
+
+    Returns:
+        The first matching config key, or None if no tier matches.
+    """
     # Tier 2: Normalized match (lowercase + underscore)
     normalized_input: str = _normalize_key(cleaned_name)
-    for config_key, config_data in licenses.items():
+    for config_key in config_keys:
         if _normalize_key(config_key) == normalized_input:
-            return float(config_data["pricePerUserPerMonth"])
+            return config_key
 
     # Tier 3: Case-insensitive iteration (no underscore normalization)
     lower_input: str = cleaned_name.lower()
-    for config_key, config_data in licenses.items():
+    for config_key in config_keys:
         if config_key.lower() == lower_input:
-            return float(config_data["pricePerUserPerMonth"])
+            return config_key
 
-    # No match found across all three tiers
-    raise KeyError(
-        f"License '{license_name}' not found in pricing config. "
-        f"Available: {list(licenses.keys())}"
-    )
+    return None
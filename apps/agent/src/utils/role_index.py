@@ -0,0 +1,63 @@
+"""Per-role row lookup for role-keyed DataFrames.
+
+Algorithms that analyze one role at a time start by selecting that role's
+rows, e.g. ``security_config[security_config["securityrole"] == role_name]``.
+A driver that calls such an algorithm for every role repeats that full
+column scan per role, which is O(roles x rows) overall.
+
+``build_role_index`` indexes a frame by its role column once (sorted, so
+lookups are binary searches); ``select_role`` then returns a role's rows
+by index lookup when given an indexed frame, and falls back to the column
+comparison for a plain frame.  Algorithms call ``select_role`` so that
+callers may pass either form.
+
+Usage:
+    from src.utils.role_index import build_role_index, select_role
+
+    indexed = build_role_index(security_config, "securityrole")
+    for role in roles:
+        role_rows = select_role(indexed, "securityrole", role)
+"""
+
+from __future__ import annotations
+
+import pandas as pd
+
+__all__ = ["build_role_index", "select_role"]
+
+
+def build_role_index(df: pd.DataFrame, column: str) -> pd.DataFrame:
+    """Index a frame by its role column for repeated per-role selection.
+
+    The column is kept (``drop=False``) so code reading it keeps working,
+    and the sort is stable so each role's rows stay in their original
+    relative order.
+
+    Args:
+        df: Frame with a role column (e.g. security config, user roles).
+        column: Name of the role column (e.g. "securityrole", "role_name").
+
+    Returns:
+        The frame indexed and sorted by ``column``.
+    """
+    return df.set_index(column, drop=False).sort_index(kind="stable")
+
+
+def select_role(df: pd.DataFrame, column: str, role_name: str) -> pd.DataFrame:
+    """Select the rows of one role.
+
+    Args:
+        df: Frame with a role column, either as built by
+            ``build_role_index`` or a plain frame.
+        column: Name of the role column.
+        role_name: Role whose rows to select.
+
+    Returns:
+        The role's rows in their original relative order; an empty frame
+        with the same columns if the role has none.
+    """
+    if df.index.name != column:
+        return df[df[column] == role_name]
+    if role_name not in df.index:
+        return df.iloc[0:0]
+    return df.loc[[role_name]]
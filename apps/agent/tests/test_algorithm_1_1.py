@@ -751,3 +751,41 @@ class TestCommerceLicenseType:
         assert result.license_composition["Commerce"].count == 2
         assert abs(result.license_composition["Commerce"].percentage - 66.67) < 0.1
         assert result.highest_license == "Commerce"
+
+
+# ---------------------------------------------------------------------------
+# Test: Precomputed Row Indices
+# ---------------------------------------------------------------------------
+
+
+class TestPrecomputedRowIndices:
+    """Test scenario: Caller passes the role's row positions directly.
+
+    Callers analyzing many roles can group the data once and hand each
+    role's positions to analyze_role_composition instead of re-filtering.
+    The result must match the filtered (row_indices=None) analysis.
+    """
+
+    def test_row_indices_match_filtered_analysis(self) -> None:
+        """Positional selection gives the same composition as filtering."""
+        # -- Arrange --
+        security_config: pd.DataFrame = _load_security_config()
+        pricing: dict[str, Any] = _load_pricing()
+        indices = security_config.groupby("securityrole", sort=False).indices
+
+        for role_name, row_indices in indices.items():
+            # -- Act --
+            by_index: RoleComposition = analyze_role_composition(
+                security_config=security_config,
+                role_name=role_name,
+                pricing_config=pricing,
+                row_indices=row_indices,
+            )
+            filtered: RoleComposition = analyze_role_composition(
+                security_config=security_config,
+                role_name=role_name,
+                pricing_config=pricing,
+            )
+
+            # -- Assert --
+            assert by_index == filtered, f"Mismatch for role {role_name!r}"
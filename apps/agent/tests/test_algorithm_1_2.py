@@ -35,6 +35,7 @@ from src.algorithms.algorithm_1_2_user_segment_analyzer import (
     UserSegmentAnalysis,
     UserSegmentDetail,
     analyze_user_segments,
+    analyze_user_segments_batch,
 )
 
 # ---------------------------------------------------------------------------
@@ -588,3 +589,119 @@ class TestAlgorithmMetadata:
 
         # -- Assert --
         assert result.algorithm_id == "1.2"
+
+
+class TestBatchAnalysis:
+    """Test scenario: Analyze several roles with one shared license map."""
+
+    def test_batch_matches_per_role_analysis(self) -> None:
+        """Batch results should equal analyze_user_segments per role."""
+        # -- Arrange --
+        sec_config = _build_security_config(
+            [
+                ("RoleA", "GeneralJournal", "Write", "Finance", 180),
+                ("RoleA", "PurchaseOrder", "Write", "SCM", 180),
+                ("RoleB", "TimeEntry", "Read", "Team Members", 60),
+            ]
+        )
+        assignments = _build_user_role_assignments(
+            [
+                ("USR_A", "Alice", "RoleA"),
+                ("USR_B", "Bob", "RoleA"),
+                ("USR_C", "Carol", "RoleB"),
+            ]
+        )
+        activity = _build_activity_df(
+            [
+                ("USR_A", "GeneralJournal", "Write", "Finance", "General Ledger"),
+                ("USR_A", "PurchaseOrder", "Read", "SCM", "Procurement"),
+                ("USR_C", "TimeEntry", "Read", "Team Members", "Timesheets"),
+            ]
+        )
+
+        # -- Act --
+        results = analyze_user_segments_batch(
+            user_role_assignments=assignments,
+            user_activity=activity,
+            security_config=sec_config,
+            role_names=["RoleA", "RoleB", "NoSuchRole"],
+            analysis_days=3650,
+        )
+
+        # -- Assert --
+        assert [r.role_name for r in results] == ["RoleA", "RoleB", "NoSuchRole"]
+        for result in results:
+            expected = analyze_user_segments(
+                role_name=result.role_name,
+                user_role_assignments=assignments,
+                user_activity=activity,
+                security_config=sec_config,
+                analysis_days=3650,
+            )
+            assert result == expected
+        assert results[0].segments["Mixed-Usage"].count == 1
+        assert results[0].segments["Inactive"].count == 1
+        assert results[1].segments["Team-Members-Only"].count == 1
+        assert results[2].total_users == 0
+
+    def test_batch_discovers_all_roles(self) -> None:
+        """With role_names=None, every assigned role is analyzed."""
+        # -- Arrange --
+        sec_config = _build_security_config([("RoleA", "Form_A", "Read", "Finance", 180)])
+        assignments = _build_user_role_assignments(
+            [("USR_A", "Alice", "RoleB"), ("USR_B", "Bob", "RoleA")]
+        )
+        activity = _build_activity_df([])
+
+        # -- Act --
+        results = analyze_user_segments_batch(
+            user_role_assignments=assignments,
+            user_activity=activity,
+            security_config=sec_config,
+        )
+
+        # -- Assert --
+        assert [r.role_name for r in results] == ["RoleA", "RoleB"]
+
+
+class TestSummaryOnlyOutput:
+    """Test scenario: Caller needs segment counts only, not per-user detail."""
+
+    def test_detail_and_user_ids_can_be_skipped(self) -> None:
+        """Counts and percentages are unchanged when detail is skipped."""
+        # -- Arrange --
+        sec_config = _build_security_config(
+            [
+                ("SummaryRole", "GeneralJournal", "Write", "Finance", 180),
+                ("SummaryRole", "PurchaseOrder", "Write", "SCM", 180),
+            ]
+        )
+        assignments = _build_user_role_assignments(
+            [
+                ("USR_A", "Alice", "SummaryRole"),
+                ("USR_B", "Bob", "SummaryRole"),
+            ]
+        )
+        activity = _build_activity_df(
+            [("USR_A", "GeneralJournal", "Write", "Finance", "General Ledger")]
+        )
+        kwargs: dict[str, Any] = {
+            "role_name": "SummaryRole",
+            "user_role_assignments": assignments,
+            "user_activity": activity,
+            "security_config": sec_config,
+            "analysis_days": 3650,
+        }
+
+        # -- Act --
+        full = analyze_user_segments(**kwargs)
+        summary = analyze_user_segments(**kwargs, return_detail=False, include_user_ids=False)
+
+        # -- Assert --
+        assert len(full.detailed_breakdown) == 2
+        assert summary.detailed_breakdown == []
+        assert full.segments["Finance-Only"].user_ids == ["USR_A"]
+        for name, stats in summary.segments.items():
+            assert stats.user_ids == []
+            assert stats.count == full.segments[name].count
+            assert stats.percentage == full.segments[name].percentage
@@ -39,7 +39,10 @@ import pandas as pd
 from src.algorithms.algorithm_1_4_component_removal import (
     ComponentRemovalResult,
     recommend_component_removal,
+    recommend_component_removal_batch,
 )
+from src.utils.frames import as_categorical
+from src.utils.role_index import build_role_index
 
 # ---------------------------------------------------------------------------
 # Constants
@@ -693,6 +696,39 @@ class TestConfigurableUsageThreshold:
         assert result.should_remove is False
         assert len(result.components_to_remove) == 0
 
+    def test_usage_exactly_at_threshold_is_not_a_candidate(self) -> None:
+        """Usage equal to the threshold is not below it.
+
+        29 of 50 users is exactly 58%, although 29 / 50 * 100 evaluates to
+        57.99999999999999 in floating point.
+        """
+        # -- Arrange --
+        role_name = "ThresholdTest"
+        user_ids = [f"USR{i:03d}" for i in range(50)]
+        security_config = _build_security_config(
+            role_name,
+            [("RareFinanceForm", "Finance", "Read")],
+        )
+        user_roles = _build_user_roles(role_name, user_ids)
+        user_activity = _build_user_activity(
+            [(f"USR{i:03d}", "RareFinanceForm", "Read") for i in range(29)]
+        )
+        pricing = _load_pricing()
+
+        # -- Act --
+        result = recommend_component_removal(
+            role_name=role_name,
+            security_config=security_config,
+            user_roles=user_roles,
+            user_activity=user_activity,
+            pricing_config=pricing,
+            usage_threshold=58.0,
+        )
+
+        # -- Assert --
+        assert result.should_remove is False
+        assert len(result.components_to_remove) == 0
+
 
 # ---------------------------------------------------------------------------
 # Test 9: Mixed license tiers -> Only high-license items considered
@@ -844,3 +880,293 @@ class TestRoleNameInResult:
 
         # -- Assert --
         assert result.role_name == role_name
+
+
+# ---------------------------------------------------------------------------
+# Test: Role-indexed inputs
+# ---------------------------------------------------------------------------
+
+
+class TestRoleIndexedInputs:
+    """Test scenario: Driver pre-indexes the role-keyed frames once.
+
+    Frames indexed with build_role_index must give the same result as the
+    plain frames, including for a role that has no rows.
+    """
+
+    def test_indexed_frames_match_plain_frames(self) -> None:
+        """Index lookup selects the same rows as the column comparison."""
+        # -- Arrange --
+        security_config = pd.concat(
+            [
+                _build_security_config(
+                    "RoleA",
+                    [
+                        ("LedgerJournal", "Finance", "Write"),
+                        ("SalesOrder", "Commerce", "Write"),
+                        ("ViewReport", "Team Members", "Read"),
+                    ],
+                ),
+                _build_security_config("RoleB", [("PurchOrder", "SCM", "Write")]),
+            ],
+            ignore_index=True,
+        )
+        user_roles = pd.concat(
+            [
+                _build_user_roles("RoleA", [f"USR{i:02d}" for i in range(20)]),
+                _build_user_roles("RoleB", ["USR99"]),
+            ],
+            ignore_index=True,
+        )
+        user_activity = _build_user_activity([("USR00", "SalesOrder", "Write")])
+        pricing = _load_pricing()
+        indexed_config = build_role_index(security_config, "securityrole")
+        indexed_roles = build_role_index(user_roles, "role_name")
+
+        for role_name in ("RoleA", "RoleB", "NoSuchRole"):
+            # -- Act --
+            plain = recommend_component_removal(
+                role_name=role_name,
+                security_config=security_config,
+                user_roles=user_roles,
+                user_activity=user_activity,
+                pricing_config=pricing,
+            )
+            indexed = recommend_component_removal(
+                role_name=role_name,
+                security_config=indexed_config,
+                user_roles=indexed_roles,
+                user_activity=user_activity,
+                pricing_config=pricing,
+            )
+
+            # -- Assert --
+            assert indexed == plain, f"Mismatch for role {role_name!r}"
+
+    def test_categorical_frames_match_plain_frames(self) -> None:
+        """Category-typed string columns give the same result."""
+        # -- Arrange --
+        security_config = _build_security_config(
+            "RoleA",
+            [
+                ("LedgerJournal", "Finance", "Write"),
+                ("SalesOrder", "Commerce", "Write"),
+                ("Posting", "Finance", "Write"),
+            ],
+        )
+        user_roles = _build_user_roles("RoleA", [f"USR{i:02d}" for i in range(20)])
+        user_activity = _build_user_activity([("USR00", "SalesOrder", "Write")])
+        pricing = _load_pricing()
+
+        # -- Act --
+        plain = recommend_component_removal(
+            role_name="RoleA",
+            security_config=security_config,
+            user_roles=user_roles,
+            user_activity=user_activity,
+            pricing_config=pricing,
+        )
+        categorical = recommend_component_removal(
+            role_name="RoleA",
+            security_config=as_categorical(
+                security_config, ["securityrole", "AOTName", "LicenseType"]
+            ),
+            user_roles=as_categorical(user_roles, ["user_id", "role_name"]),
+            user_activity=as_categorical(user_activity, ["user_id", "menu_item"]),
+            pricing_config=pricing,
+        )
+
+        # -- Assert --
+        assert categorical == plain
+        assert len(plain.components_to_remove) == 2
+
+
+# ---------------------------------------------------------------------------
+# Test: Batch analysis of many roles
+# ---------------------------------------------------------------------------
+
+
+class TestBatchAnalysis:
+    """Test scenario: All roles analyzed in one batch call.
+
+    The batch must give the same result per role as individual calls,
+    including for a role with no users and a role not in the config.
+    """
+
+    def test_batch_matches_per_role_calls(self) -> None:
+        """Each batch result equals the single-role result."""
+        # -- Arrange --
+        security_config = pd.concat(
+            [
+                _build_security_config(
+                    "RoleA",
+                    [
+                        ("LedgerJournal", "Finance", "Write"),
+                        ("SalesOrder", "Commerce", "Write"),
+                    ],
+                ),
+                _build_security_config("RoleB", [("PurchOrder", "SCM", "Write")]),
+                _build_security_config("RoleC", [("Posting", "Finance", "Write")]),
+            ],
+            ignore_index=True,
+        )
+        user_roles = pd.concat(
+            [
+                _build_user_roles("RoleA", [f"USR{i:02d}" for i in range(30)]),
+                _build_user_roles("RoleB", [f"USR{i:02d}" for i in range(25, 40)]),
+            ],
+            ignore_index=True,
+        )
+        user_activity = _build_user_activity(
+            [
+                ("USR00", "SalesOrder", "Write"),
+                ("USR26", "PurchOrder", "Write"),
+                ("USR27", "PurchOrder", "Write"),
+                ("USR99", "LedgerJournal", "Write"),
+            ]
+        )
+        pricing = _load_pricing()
+        role_names = ["RoleA", "RoleB", "RoleC", "NoSuchRole"]
+
+        # -- Act --
+        batch = recommend_component_removal_batch(
+            security_config=security_config,
+            user_roles=user_roles,
+            user_activity=user_activity,
+            pricing_config=pricing,
+            role_names=role_names,
+        )
+
+        # -- Assert --
+        assert [r.role_name for r in batch] == role_names
+        for result in batch:
+            single = recommend_component_removal(
+                role_name=result.role_name,
+                security_config=security_config,
+                user_roles=user_roles,
+                user_activity=user_activity,
+                pricing_config=pricing,
+            )
+            assert result == single, f"Mismatch for role {result.role_name!r}"
+
+    def test_role_indexed_frames_match_plain_frames(self) -> None:
+        """Frames pre-indexed with build_role_index give the same batch results."""
+        # -- Arrange --
+        security_config = pd.concat(
+            [
+                _build_security_config(
+                    "RoleA",
+                    [
+                        ("LedgerJournal", "Finance", "Write"),
+                        ("SalesOrder", "Commerce", "Write"),
+                    ],
+                ),
+                _build_security_config("RoleB", [("PurchOrder", "SCM", "Write")]),
+            ],
+            ignore_index=True,
+        )
+        user_roles = pd.concat(
+            [
+                _build_user_roles("RoleA", [f"USR{i:02d}" for i in range(30)]),
+                _build_user_roles("RoleB", [f"USR{i:02d}" for i in range(25, 40)]),
+            ],
+            ignore_index=True,
+        )
+        user_activity = _build_user_activity(
+            [("USR00", "SalesOrder", "Write"), ("USR26", "PurchOrder", "Write")]
+        )
+        pricing = _load_pricing()
+        role_names = ["RoleA", "RoleB", "NoSuchRole"]
+
+        # -- Act --
+        plain = recommend_component_removal_batch(
+            security_config=security_config,
+            user_roles=user_roles,
+            user_activity=user_activity,
+            pricing_config=pricing,
+            role_names=role_names,
+        )
+        indexed = recommend_component_removal_batch(
+            security_config=build_role_index(security_config, "securityrole"),
+            user_roles=build_role_index(user_roles, "role_name"),
+            user_activity=user_activity,
+            pricing_config=pricing,
+            role_names=role_names,
+        )
+
+        # -- Assert --
+        assert indexed == plain
+
+    def test_worker_pool_matches_sequential_batch(self) -> None:
+        """Analyzing roles in worker processes gives the same ordered results."""
+        # -- Arrange --
+        role_names = [f"Role{r}" for r in range(6)]
+        security_config = pd.concat(
+            [
+                _build_security_config(
+                    name,
+                    [
+                        ("LedgerJournal", "Finance", "Write"),
+                        ("SalesOrder", "Commerce", "Write"),
+                        ("Posting", "Finance", "Write"),
+                    ],
+                )
+                for name in role_names
+            ],
+            ignore_index=True,
+        )
+        user_roles = pd.concat(
+            [
+                _build_user_roles(name, [f"USR{i:02d}" for i in range(r, r + 20)])
+                for r, name in enumerate(role_names)
+            ],
+            ignore_index=True,
+        )
+        user_activity = _build_user_activity(
+            [(f"USR{i:02d}", "SalesOrder", "Write") for i in range(0, 25, 4)]
+        )
+        pricing = _load_pricing()
+
+        # -- Act --
+        sequential = recommend_component_removal_batch(
+            security_config=security_config,
+            user_roles=user_roles,
+            user_activity=user_activity,
+            pricing_config=pricing,
+            role_names=role_names,
+        )
+        pooled = recommend_component_removal_batch(
+            security_config=security_config,
+            user_roles=user_roles,
+            user_activity=user_activity,
+            pricing_config=pricing,
+            role_names=role_names,
+            max_workers=2,
+        )
+
+        # -- Assert --
+        assert pooled == sequential
+
+    def test_role_names_default_to_all_configured_roles(self) -> None:
+        """Without role_names, every role in the security config is analyzed."""
+        # -- Arrange --
+        security_config = pd.concat(
+            [
+                _build_security_config("RoleB", [("PurchOrder", "SCM", "Write")]),
+                _build_security_config("RoleA", [("SalesOrder", "Commerce", "Write")]),
+            ],
+            ignore_index=True,
+        )
+        user_roles = _build_user_roles("RoleA", ["USR01", "USR02"])
+        user_activity = _build_user_activity([("USR01", "SalesOrder", "Write")])
+
+        # -- Act --
+        batch = recommend_component_removal_batch(
+            security_config=security_config,
+            user_roles=user_roles,
+            user_activity=user_activity,
+            pricing_config=_load_pricing(),
+        )
+
+        # -- Assert --
+        assert [r.role_name for r in batch] == ["RoleA", "RoleB"]
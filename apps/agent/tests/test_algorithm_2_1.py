@@ -34,6 +34,7 @@ from pathlib import Path
 from typing import Any
 
 import pandas as pd
+import pytest
 
 # ---------------------------------------------------------------------------
 # Constants
@@ -809,6 +810,81 @@ class TestOutputStructure:
             assert rec.current_license is not None
             assert rec.current_license_cost_monthly >= 0
 
+    def test_output_passes_full_schema_validation(self) -> None:
+        """Unvalidated construction must still yield schema-valid models."""
+        from src.algorithms.algorithm_2_1_permission_usage_analyzer import (
+            analyze_permission_usage,
+        )
+        from src.models.output_schemas import LicenseRecommendation, RecommendationAction
+
+        # -- Arrange --
+        security_config = _build_security_config(
+            {
+                "Accountant": [
+                    ("GeneralJournalEntry", "Finance"),
+                    ("HcmESSWorkspace", "Team Members"),
+                ],
+                "Clerk": [(f"ClerkForm{i}", "Operations") for i in range(5)],
+            }
+        )
+        user_roles = _build_user_role_assignments(
+            [("USR_DOWN", "Accountant"), ("USR_REVIEW", "Clerk"), ("USR_OK", "Accountant")]
+        )
+        user_activity = _build_multi_user_activity(
+            {
+                "USR_DOWN": [("HcmESSWorkspace", "Read", "Team Members")] * 100,
+                "USR_REVIEW": [("ClerkForm0", "Write", "Operations")] * 20,
+                "USR_OK": [
+                    ("GeneralJournalEntry", "Write", "Finance"),
+                    ("HcmESSWorkspace", "Read", "Team Members"),
+                ]
+                * 20,
+            }
+        )
+        pricing = _load_pricing()
+
+        # -- Act --
+        results = analyze_permission_usage(
+            user_activity=user_activity,
+            security_config=security_config,
+            user_role_assignments=user_roles,
+            pricing_config=pricing,
+        )
+
+        # -- Assert --
+        assert {rec.action for rec in results} == {
+            RecommendationAction.DOWNGRADE,
+            RecommendationAction.REVIEW_REQUIRED,
+            RecommendationAction.NO_CHANGE,
+        }
+        for rec in results:
+            assert LicenseRecommendation.model_validate(rec.model_dump()) == rec
+
+    def test_analysis_period_out_of_range_rejected(self) -> None:
+        """analysis_period_days outside the schema range raises ValueError."""
+        from src.algorithms.algorithm_2_1_permission_usage_analyzer import (
+            analyze_permission_usage,
+        )
+
+        # -- Arrange --
+        security_config = _build_security_config(
+            {"Accountant": [("GeneralJournalEntry", "Finance")]}
+        )
+        user_roles = _build_user_role_assignments([("USR_PERIOD", "Accountant")])
+        user_activity = _build_activity_df(
+            "USR_PERIOD", [("GeneralJournalEntry", "Read", "Finance")] * 10
+        )
+
+        # -- Act / Assert --
+        with pytest.raises(ValueError, match="analysis_period_days"):
+            analyze_permission_usage(
+                user_activity=user_activity,
+                security_config=security_config,
+                user_role_assignments=user_roles,
+                pricing_config=_load_pricing(),
+                analysis_period_days=0,
+            )
+
 
 # ---------------------------------------------------------------------------
 # Test 10: Batch processing with mixed user profiles
@@ -1017,3 +1093,171 @@ class TestUserWithNoRoles:
         # -- Assert --
         # Either empty results or results without crash
         assert isinstance(results, list)
+
+
+# ---------------------------------------------------------------------------
+# Test 13: Narrative text can be skipped for batch workflows
+# ---------------------------------------------------------------------------
+
+
+class TestNarrativeOptional:
+    """Skipping the narrative must not change any decision.
+
+    With build_narrative=False every recommendation matches the default
+    run except that its reason carries no text.
+    """
+
+    def test_without_narrative_only_reason_text_differs(self) -> None:
+        """Actions, costs and savings match; reasons are empty."""
+        from src.algorithms.algorithm_2_1_permission_usage_analyzer import (
+            analyze_permission_usage,
+        )
+
+        # -- Arrange --
+        security_config = _build_security_config(
+            {
+                "Accountant": [
+                    ("GeneralJournalEntry", "Finance"),
+                    ("HcmESSWorkspace", "Team Members"),
+                ],
+                "Clerk": [(f"ClerkForm{i}", "Operations") for i in range(5)],
+            }
+        )
+        user_roles = _build_user_role_assignments(
+            [("USR_DOWN", "Accountant"), ("USR_REVIEW", "Clerk"), ("USR_OK", "Accountant")]
+        )
+        user_activity = _build_multi_user_activity(
+            {
+                "USR_DOWN": [("HcmESSWorkspace", "Read", "Team Members")] * 100,
+                "USR_REVIEW": [("ClerkForm0", "Write", "Operations")] * 20,
+                "USR_OK": [
+                    ("GeneralJournalEntry", "Write", "Finance"),
+                    ("HcmESSWorkspace", "Read", "Team Members"),
+                ]
+                * 20,
+            }
+        )
+        pricing = _load_pricing()
+        volatile = {"recommendation_id", "generated_at", "reason"}
+
+        # -- Act --
+        full = analyze_permission_usage(
+            user_activity=user_activity,
+            security_config=security_config,
+            user_role_assignments=user_roles,
+            pricing_config=pricing,
+        )
+        bare = analyze_permission_usage(
+            user_activity=user_activity,
+            security_config=security_config,
+            user_role_assignments=user_roles,
+            pricing_config=pricing,
+            build_narrative=False,
+        )
+
+        # -- Assert --
+        assert [r.model_dump(exclude=volatile) for r in bare] == [
+            r.model_dump(exclude=volatile) for r in full
+        ]
+        for rec in bare:
+            assert rec.reason.primary_factor == ""
+            assert rec.reason.supporting_factors == []
+            assert rec.reason.risk_factors == []
+
+
+# ---------------------------------------------------------------------------
+# Test 14: Cached tag combinations are not shared between recommendations
+# ---------------------------------------------------------------------------
+
+
+class TestTagsIndependent:
+    """Each recommendation gets its own tags list even when tags repeat."""
+
+    def test_mutating_one_recommendations_tags_leaves_others_intact(self) -> None:
+        """Users with identical tag sets do not alias the same list."""
+        from src.algorithms.algorithm_2_1_permission_usage_analyzer import (
+            analyze_permission_usage,
+        )
+
+        # -- Arrange --
+        security_config = _build_security_config(
+            {
+                "Accountant": [
+                    ("GeneralJournalEntry", "Finance"),
+                    ("HcmESSWorkspace", "Team Members"),
+                ],
+            }
+        )
+        user_roles = _build_user_role_assignments(
+            [("USR_A", "Accountant"), ("USR_B", "Accountant")]
+        )
+        user_activity = _build_multi_user_activity(
+            {
+                "USR_A": [("HcmESSWorkspace", "Read", "Team Members")] * 100,
+                "USR_B": [("HcmESSWorkspace", "Read", "Team Members")] * 100,
+            }
+        )
+
+        # -- Act --
+        results = analyze_permission_usage(
+            user_activity=user_activity,
+            security_config=security_config,
+            user_role_assignments=user_roles,
+            pricing_config=_load_pricing(),
+        )
+
+        # -- Assert --
+        assert len(results) == 2
+        first, second = results
+        assert first.tags == second.tags
+        first.tags.append("reviewed")
+        assert "reviewed" not in second.tags
+
+
+# ---------------------------------------------------------------------------
+# Test 15: Menu items repeated across tiers within a role count once
+# ---------------------------------------------------------------------------
+
+
+class TestDuplicateRolePermissions:
+    """A (role, menu item) pair listed under several tiers is one permission."""
+
+    def test_repeated_item_counts_once_and_keeps_highest_tier(self) -> None:
+        """Using every distinct item is full utilization at the highest tier."""
+        from src.algorithms.algorithm_2_1_permission_usage_analyzer import (
+            analyze_permission_usage,
+        )
+        from src.models.output_schemas import RecommendationAction
+
+        # -- Arrange --
+        security_config = _build_security_config(
+            {
+                "Accountant": [
+                    ("GeneralJournalEntry", "Team Members"),
+                    ("GeneralJournalEntry", "Finance"),
+                    ("GeneralJournalEntry", "Finance"),
+                    ("HcmESSWorkspace", "Team Members"),
+                ],
+            }
+        )
+        user_roles = _build_user_role_assignments([("USR_DUP", "Accountant")])
+        user_activity = _build_activity_df(
+            "USR_DUP",
+            [("GeneralJournalEntry", "Write", "Finance")] * 50
+            + [("HcmESSWorkspace", "Read", "Team Members")] * 50,
+        )
+
+        # -- Act --
+        results = analyze_permission_usage(
+            user_activity=user_activity,
+            security_config=security_config,
+            user_role_assignments=user_roles,
+            pricing_config=_load_pricing(),
+        )
+
+        # -- Assert --
+        assert len(results) == 1
+        rec = results[0]
+        assert rec.action == RecommendationAction.NO_CHANGE
+        assert rec.current_license == "Finance"
+        assert "low_utilization" not in rec.tags
@@ -33,6 +33,7 @@ from src.models.output_schemas import (
     LicenseRecommendation,
     RecommendationAction,
 )
+from src.utils.frames import as_categorical
 
 # ---------------------------------------------------------------------------
 # Constants
@@ -1344,3 +1345,210 @@ class TestResultsSortedBySavings:
             f"first={downgrade_results[0].savings.annual_savings}, "
             f"second={downgrade_results[1].savings.annual_savings}"
         )
+
+
+# ---------------------------------------------------------------------------
+# Test: Categorical Activity Columns
+# ---------------------------------------------------------------------------
+
+
+class TestCategoricalActivityColumns:
+    """Test scenario: Activity string columns stored as ``category`` dtype.
+
+    Converting the repeated string columns once at load time must not
+    change any recommendation.
+    """
+
+    def test_categorical_input_matches_plain_input(self) -> None:
+        """Category columns give the same recommendations as object columns."""
+        # -- Arrange --
+        users: list[tuple[str, int, list[tuple[str, int, str, str]], str]] = [
+            ("CAT_DOWN", 194, [("UserProfile", 6, "Team Members", "Self-Service")], "Finance"),
+            ("CAT_KEEP", 192, [("PurchaseOrder", 8, "SCM", "Procurement")], "SCM"),
+            ("CAT_LOW", 160, [("PurchaseOrder", 40, "SCM", "Procurement")], "SCM"),
+        ]
+        activity: pd.DataFrame = _build_multi_user_activity_df(users)
+        security_config: pd.DataFrame = _load_security_config()
+        pricing: dict[str, Any] = _load_pricing()
+        volatile: set[str] = {"recommendation_id", "generated_at"}
+
+        # -- Act --
+        plain: list[LicenseRecommendation] = detect_readonly_users(
+            user_activity=activity,
+            security_config=security_config,
+            pricing_config=pricing,
+        )
+        categorical: list[LicenseRecommendation] = detect_readonly_users(
+            user_activity=as_categorical(
+                activity, ["user_id", "menu_item", "action", "license_tier"]
+            ),
+            security_config=security_config,
+            pricing_config=pricing,
+        )
+
+        # -- Assert --
+        assert len(plain) == 2
+        assert [r.model_dump(exclude=volatile) for r in categorical] == [
+            r.model_dump(exclude=volatile) for r in plain
+        ]
+
+
+# ---------------------------------------------------------------------------
+# Test: Nullable String Action Column With a Missing Value
+# ---------------------------------------------------------------------------
+
+
+class TestNullableStringAction:
+    """Test scenario: ``action`` is a nullable ``string`` column with one NA.
+
+    The missing action is not a read, so it counts toward the user's
+    operations without being read-only; detection must not fail on it.
+    """
+
+    def test_missing_action_is_not_a_read(self) -> None:
+        """One NA action among 200 operations still leaves a downgrade."""
+        # -- Arrange --
+        activity: pd.DataFrame = _build_multi_user_activity_df(
+            [("NA_DOWN", 194, [("UserProfile", 6, "Team Members", "Self-Service")], "Finance")]
+        )
+        activity["action"] = activity["action"].astype("string")
+        activity.loc[0, "action"] = pd.NA
+
+        # -- Act --
+        results: list[LicenseRecommendation] = detect_readonly_users(
+            user_activity=activity,
+            security_config=_load_security_config(),
+            pricing_config=_load_pricing(),
+        )
+
+        # -- Assert --
+        assert len(results) == 1
+        rec = results[0]
+        assert rec.action == RecommendationAction.DOWNGRADE
+        assert rec.recommended_license == "Team Members"
+        assert rec.savings is not None
+        assert abs(rec.savings.annual_savings - 1440.0) <= MONETARY_TOLERANCE
+
+
+# ---------------------------------------------------------------------------
+# Test: Output Models Satisfy the Schema
+# ---------------------------------------------------------------------------
+
+
+class TestOutputSchemaValidation:
+    """Test scenario: Every output model passes full schema validation.
+
+    Recommendations are built without per-instance validation, so each
+    one is re-validated here against the LicenseRecommendation schema.
+    """
+
+    def test_output_passes_full_schema_validation(self) -> None:
+        """Downgrade and no-change recommendations round-trip through validation."""
+        # -- Arrange --
+        users: list[tuple[str, int, list[tuple[str, int, str, str]], str]] = [
+            ("VAL_ZERO", 200, [], "Commerce"),
+            ("VAL_SELF", 194, [("UserProfile", 6, "Team Members", "Self-Service")], "Finance"),
+            ("VAL_MEDIUM", 192, [("PurchaseOrder", 8, "SCM", "Procurement")], "SCM"),
+            ("VAL_TM", 196, [("TimeEntry", 4, "Team Members", "Self-Service")], "Team Members"),
+        ]
+        activity: pd.DataFrame = _build_multi_user_activity_df(users)
+
+        # -- Act --
+        results: list[LicenseRecommendation] = detect_readonly_users(
+            user_activity=activity,
+            security_config=_load_security_config(),
+            pricing_config=_load_pricing(),
+        )
+
+        # -- Assert --
+        assert {rec.action for rec in results} == {
+            RecommendationAction.DOWNGRADE,
+            RecommendationAction.NO_CHANGE,
+        }
+        assert len(results) == 4
+        for rec in results:
+            assert LicenseRecommendation.model_validate(rec.model_dump()) == rec
+
+
+# ---------------------------------------------------------------------------
+# Test: Narrative Text Can Be Skipped
+# ---------------------------------------------------------------------------
+
+
+class TestNarrativeOptional:
+    """Test scenario: Batch run without the human-readable reason text.
+
+    With build_narrative=False every recommendation matches the default
+    run except that its reason carries no text.
+    """
+
+    def test_without_narrative_only_reason_text_differs(self) -> None:
+        """Actions, costs and savings match; reasons are empty."""
+        # -- Arrange --
+        users: list[tuple[str, int, list[tuple[str, int, str, str]], str]] = [
+            ("NARR_DOWN", 194, [("UserProfile", 6, "Team Members", "Self-Service")], "Finance"),
+            ("NARR_KEEP", 192, [("PurchaseOrder", 8, "SCM", "Procurement")], "SCM"),
+        ]
+        activity: pd.DataFrame = _build_multi_user_activity_df(users)
+        security_config: pd.DataFrame = _load_security_config()
+        pricing: dict[str, Any] = _load_pricing()
+        volatile: set[str] = {"recommendation_id", "generated_at", "reason"}
+
+        # -- Act --
+        full: list[LicenseRecommendation] = detect_readonly_users(
+            user_activity=activity,
+            security_config=security_config,
+            pricing_config=pricing,
+        )
+        bare: list[LicenseRecommendation] = detect_readonly_users(
+            user_activity=activity,
+            security_config=security_config,
+            pricing_config=pricing,
+            build_narrative=False,
+        )
+
+        # -- Assert --
+        assert len(bare) == 2
+        assert [r.model_dump(exclude=volatile) for r in bare] == [
+            r.model_dump(exclude=volatile) for r in full
+        ]
+        for rec in bare:
+            assert rec.reason.primary_factor == ""
+            assert rec.reason.supporting_factors == []
+            assert rec.reason.risk_factors == []
+
+
+# ---------------------------------------------------------------------------
+# Test: Tags Are Not Shared Between Recommendations
+# ---------------------------------------------------------------------------
+
+
+class TestTagsIndependent:
+    """Test scenario: Two users with identical tag sets.
+
+    Tag combinations are cached, but each recommendation must still own
+    its tags list.
+    """
+
+    def test_mutating_one_recommendations_tags_leaves_others_intact(self) -> None:
+        """Appending to one user's tags does not affect the other's."""
+        # -- Arrange --
+        users: list[tuple[str, int, list[tuple[str, int, str, str]], str]] = [
+            ("TAG_A", 200, [], "Finance"),
+            ("TAG_B", 200, [], "Finance"),
+        ]
+        activity: pd.DataFrame = _build_multi_user_activity_df(users)
+
+        # -- Act --
+        results: list[LicenseRecommendation] = detect_readonly_users(
+            user_activity=activity,
+            security_config=_load_security_config(),
+            pricing_config=_load_pricing(),
+        )
+
+        # -- Assert --
+        assert len(results) == 2
+        first, second = results
+        assert first.tags == second.tags
+        first.tags.append("reviewed")
+        assert "reviewed" not in second.tags
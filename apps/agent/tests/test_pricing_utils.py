@@ -261,6 +261,30 @@ class TestReturnType:
         assert result == 100.0
 
 
+# ---------------------------------------------------------------------------
+# Tests: Memoized Fallback Resolution
+# ---------------------------------------------------------------------------
+
+
+class TestMemoizedResolution:
+    """Cached fallback resolution must still follow the live config."""
+
+    def test_price_change_is_seen_after_cached_lookup(self) -> None:
+        """Only the key resolution is cached; prices are read each call."""
+        config = _minimal_pricing_config()
+        assert get_license_price(config, "Team Members") == 60.0
+        config["licenses"]["team_members"]["pricePerUserPerMonth"] = 75.0
+        assert get_license_price(config, "Team Members") == 75.0
+
+    def test_new_key_set_is_resolved_afresh(self) -> None:
+        """A config with different keys does not reuse a stale resolution."""
+        config = _minimal_pricing_config()
+        with pytest.raises(KeyError):
+            get_license_price(config, "Device")
+        config["licenses"]["device"] = {"name": "Device", "pricePerUserPerMonth": 80.0}
+        assert get_license_price(config, "Device") == 80.0
+
+
 # ---------------------------------------------------------------------------
 # Tests: Real Pricing Config Integration
 # ---------------------------------------------------------------------------
@@ -0,0 +1,109 @@
+"""Tests for the completeness checker's tool driver (scripts/run_checks.py).
+
+Covers per-file attribution in ``--by-file`` mode: every diagnostic must be
+credited to the file it names, however many diagnostics the run produces.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import sys
+from pathlib import Path
+from types import ModuleType
+
+import pytest
+
+SCRIPT_PATH = Path(__file__).parent.parent / "scripts" / "run_checks.py"
+
+
+def _load_run_checks() -> ModuleType:
+    """Import scripts/run_checks.py, which is not part of an importable package."""
+    spec = importlib.util.spec_from_file_location("run_checks", SCRIPT_PATH)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+run_checks = _load_run_checks()
+
+
+def _write_unused_imports(path: Path, count: int) -> Path:
+    """Write a module with ``count`` unused imports (one F401 diagnostic each)."""
+    modules = sorted(sys.stdlib_module_names)[:count]
+    path.write_text("".join(f"import {name}\n" for name in modules))
+    return path
+
+
+# ---------------------------------------------------------------------------
+# Test: _split_by_file attribution
+# ---------------------------------------------------------------------------
+
+
+class TestSplitByFile:
+    """Diagnostics are attributed by their ``path:`` prefix."""
+
+    def test_each_file_gets_only_its_own_diagnostics(self, tmp_path: Path) -> None:
+        """Lines naming a file fail that file; files with none pass."""
+        # -- Arrange --
+        first = tmp_path / "first.py"
+        second = tmp_path / "second.py"
+        clean = tmp_path / "clean.py"
+        output = (
+            f"{first}:1:8: F401 `os` imported but unused\n"
+            f"{second}:3:1: E402 Module level import not at top of file\n"
+            f"{first}:2:8: F401 `re` imported but unused\n"
+            "Found 3 errors.\n"
+        ).encode()
+
+        # -- Act --
+        results = run_checks._split_by_file([first, second, clean], output, 1)
+
+        # -- Assert --
+        assert results[str(first)]["returncode"] == 1
+        assert results[str(first)]["output"].count("F401") == 2
+        assert results[str(second)]["returncode"] == 1
+        assert "E402" in results[str(second)]["output"]
+        assert "F401" not in results[str(second)]["output"]
+        assert results[str(clean)] == {"returncode": 0, "output": ""}
+
+    def test_tool_failure_fails_every_file(self, tmp_path: Path) -> None:
+        """An exit code above 1 is a tool error, not a clean run."""
+        # -- Arrange --
+        files = [tmp_path / "a.py", tmp_path / "b.py"]
+
+        # -- Act --
+        results = run_checks._split_by_file(files, b"error: bad config", 2)
+
+        # -- Assert --
+        assert all(result["returncode"] == 2 for result in results.values())
+
+
+# ---------------------------------------------------------------------------
+# Test: run_checks --by-file ruff attribution
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.skipif(run_checks.find_ruff() is None, reason="ruff is not installed")
+class TestRuffByFile:
+    """Early files in a long ruff run are not reported clean."""
+
+    def test_diagnostics_beyond_output_tail_are_attributed(self, tmp_path: Path) -> None:
+        """Every file with diagnostics fails, even when output exceeds the tail."""
+        # -- Arrange --
+        per_file = run_checks.OUTPUT_TAIL_LINES
+        files = [_write_unused_imports(tmp_path / f"module_{i}.py", per_file) for i in range(3)]
+        clean = tmp_path / "clean.py"
+        clean.write_text("VALUE = 1\n")
+
+        # -- Act --
+        results = run_checks.run_checks([], [], [*files, clean], by_file=True)
+
+        # -- Assert --
+        by_file = results["ruff"]["by_file"]
+        assert results["ruff"]["returncode"] == 1
+        for path in files:
+            assert by_file[str(path)]["returncode"] == 1, path.name
+            assert path.name in by_file[str(path)]["output"]
+        assert by_file[str(clean)] == {"returncode": 0, "output": ""}